@@ -34,6 +34,7 @@ from . import providers as _providers
 AppConfig = _providers.AppConfig
 resolve_environment = _providers.resolve_environment
 get_provider = _providers.get_provider
+reset_providers = _providers.reset_providers
 bootstrap_defaults = _providers.bootstrap_defaults
 is_dev_stage = _providers.is_dev_stage
 
@@ -42,6 +43,7 @@ __all__.extend([
     "AppConfig",
     "resolve_environment",
     "get_provider",
+    "reset_providers",
     "bootstrap_defaults",
     "is_dev_stage",
 ])
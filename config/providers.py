@@ -6,6 +6,7 @@ Synthetic (dev_stage) providers. This module is kept so existing imports do not
 break immediately; all functions now delegate to micro_config.
 """
 from dataclasses import dataclass
+from functools import lru_cache
 import os
 from typing import Optional
 
@@ -75,6 +76,7 @@ class AppConfig:
     env: str
 
 
+@lru_cache(maxsize=8)
 def _validate(env: str) -> str:
     if env not in VALID_ENVS:
         raise ValueError(f"Unknown APP_ENV '{env}'. Allowed: {sorted(VALID_ENVS)}")
@@ -94,8 +96,32 @@ def resolve_environment(override: Optional[str] = None) -> str:
     return _validate(env)
 
 
+# Provider singletons keyed by everything that influences construction
+# (effective env, API key, cache dir) so repeat lookups reuse HTTP sessions
+# and synthetic RNG state instead of rebuilding providers on every call.
+_PROVIDERS: dict[tuple[str, Optional[str], Optional[str]], object] = {}
+
+
+def reset_providers() -> None:
+    """Drop cached provider instances (e.g. after changing env in tests)."""
+    _PROVIDERS.clear()
+
+
 def get_provider(override: Optional[str] = None, cli_env: Optional[str] = None):  # type: ignore[override]
     eff = override or cli_env
+    try:
+        key = (micro_resolve_env(eff), os.getenv("FINNHUB_API_KEY"), os.getenv("CACHE_DIR"))
+    except Exception:
+        # Invalid env: let the uncached path below decide how to degrade
+        return _build_provider(eff)
+    provider = _PROVIDERS.get(key)
+    if provider is None:
+        provider = _build_provider(eff)
+        _PROVIDERS[key] = provider
+    return provider
+
+
+def _build_provider(eff: Optional[str]):
     try:
         return micro_get_provider(eff)  # type: ignore[misc]
     except Exception:  # pragma: no cover
@@ -158,6 +184,7 @@ __all__ = [
     "AppConfig",
     "resolve_environment",
     "get_provider",
+    "reset_providers",
     "bootstrap_defaults",
 ]
 
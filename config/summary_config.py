@@ -4,11 +4,14 @@ Configuration for portfolio summary functionality.
 This module centralizes all configuration values that were previously
 scattered as magic numbers throughout the codebase.
 """
-from dataclasses import dataclass
-from typing import Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Iterator, Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SummaryConfig:
     """Configuration for portfolio summary generation and analysis."""
     
@@ -43,6 +46,12 @@ class SummaryConfig:
 # Global default configuration instance
 DEFAULT_CONFIG = SummaryConfig()
 
+# Immutable base that _create_test_config applies its overrides to
+_BASE_CONFIG = SummaryConfig()
+
+# Active configuration; context-local so concurrent tests/sessions don't collide
+_CURRENT_CONFIG: ContextVar[SummaryConfig] = ContextVar("summary_config", default=DEFAULT_CONFIG)
+
 
 def get_config() -> SummaryConfig:
     """
@@ -51,7 +60,7 @@ def get_config() -> SummaryConfig:
     Returns:
         Current SummaryConfig instance
     """
-    return DEFAULT_CONFIG
+    return _CURRENT_CONFIG.get()
 
 
 def set_config(config: SummaryConfig) -> None:
@@ -61,8 +70,25 @@ def set_config(config: SummaryConfig) -> None:
     Args:
         config: New configuration to use
     """
-    global DEFAULT_CONFIG
-    DEFAULT_CONFIG = config
+    _CURRENT_CONFIG.set(config)
+
+
+@contextmanager
+def override_config(config: SummaryConfig) -> Iterator[SummaryConfig]:
+    """
+    Temporarily activate a configuration for the current context.
+    
+    The previous configuration is restored on exit, so callers never need
+    to save and restore global state themselves.
+    
+    Args:
+        config: Configuration to use inside the ``with`` block
+    """
+    token = _CURRENT_CONFIG.set(config)
+    try:
+        yield config
+    finally:
+        _CURRENT_CONFIG.reset(token)
 
 
 def create_test_config(**overrides) -> SummaryConfig:
@@ -73,7 +99,8 @@ def create_test_config(**overrides) -> SummaryConfig:
         **overrides: Configuration values to override
         
     Returns:
-        New SummaryConfig instance with overrides applied
+        SummaryConfig instance with overrides applied. Instances are frozen,
+        so identical overrides share a single cached instance.
         
     Example:
         test_config = create_test_config(
@@ -81,23 +108,10 @@ def create_test_config(**overrides) -> SummaryConfig:
             min_observations_for_metrics=5
         )
     """
-    config_defaults = {
-        'default_history_months': 6,
-        'min_observations_for_metrics': 10,
-        'trading_days_per_year': 252,
-        'price_cache_ttl_minutes': 5,
-        'benchmark_symbol': '^GSPC',
-        'currency_precision': 2,
-        'percentage_precision': 2,
-        'risk_free_rate': 0.02,
-        'confidence_level': 0.95,
-        'min_position_size_for_display': 0.01,
-        'max_holdings_display': 20,
-        'max_price_change_threshold': 0.5,
-        'min_trading_volume': 1000,
-    }
-    
-    # Apply overrides
-    config_defaults.update(overrides)
-    
-    return SummaryConfig(**config_defaults)
\ No newline at end of file
+    return _create_test_config(frozenset(overrides.items()))
+
+
+@lru_cache(maxsize=64)
+def _create_test_config(overrides: frozenset) -> SummaryConfig:
+    """Build (and memoize) a SummaryConfig for a hashable set of overrides."""
+    return replace(_BASE_CONFIG, **dict(overrides))
@@ -7,6 +7,7 @@ market data services to reduce duplication and improve consistency.
 from __future__ import annotations
 
 from typing import Any, Dict, Optional, Union
+import numpy as np
 import pandas as pd
 
 
@@ -38,6 +39,26 @@ def extract_price_from_quote(quote: Optional[Dict[str, Any]]) -> Optional[float]
     return None
 
 
+def last_valid_value(values: pd.Series) -> Any:
+    """Return the last non-null element of ``values``, or None if there is none.
+
+    Equivalent to ``values.dropna().iloc[-1]`` but works on the raw NumPy
+    buffer, so the common case (last row populated) is a single element read.
+    """
+    arr = values.to_numpy()
+    if arr.size == 0:
+        return None
+    if arr.dtype.kind in "iub":
+        return arr[-1]
+    if arr.dtype.kind == "f":
+        if not np.isnan(arr[-1]):
+            return arr[-1]
+        valid = np.flatnonzero(~np.isnan(arr))
+    else:
+        valid = np.flatnonzero(values.notna().to_numpy())
+    return arr[valid[-1]] if valid.size else None
+
+
 def extract_price_from_dataframe(
     df: pd.DataFrame, 
     close_column_names: Optional[list[str]] = None
@@ -59,10 +80,10 @@ def extract_price_from_dataframe(
     
     for col_name in close_column_names:
         if col_name in df.columns:
-            close_prices = df[col_name].dropna()
-            if not close_prices.empty:
+            last = last_valid_value(df[col_name])
+            if last is not None:
                 try:
-                    price = float(close_prices.iloc[-1])
+                    price = float(last)
                     if price > 0:
                         return price
                 except (ValueError, TypeError, IndexError):
@@ -95,8 +95,8 @@ def retry_with_backoff(
             delay = base_delay * (2 ** i)
             delay = min(delay, max_delay)
             
-            # Add jitter if requested
-            if jitter:
+            # Add jitter if requested; a zero delay stays zero
+            if jitter and delay > 0:
                 jitter_amount = delay * jitter_range * random.uniform(-1, 1)
                 delay = max(0.1, delay + jitter_amount)
             
@@ -159,8 +159,8 @@ def retry_with_exception_propagation(
             delay = base_delay * (2 ** i)
             delay = min(delay, max_delay)
             
-            # Add jitter if requested
-            if jitter:
+            # Add jitter if requested; a zero delay stays zero
+            if jitter and delay > 0:
                 jitter_amount = delay * jitter_range * random.uniform(-1, 1)
                 delay = max(0.1, delay + jitter_amount)
             
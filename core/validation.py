@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import re
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from typing import Any, Optional, Tuple, Union
 
 from core.errors import ValidationError
@@ -71,6 +72,14 @@ def validate_ticker_format(ticker: str, strict: bool = True) -> bool:
     Returns:
         True if ticker format is valid, False otherwise
     """
+    if not isinstance(ticker, str):
+        return False
+    return _ticker_format_ok(ticker, strict)
+
+
+@lru_cache(maxsize=4096)
+def _ticker_format_ok(ticker: str, strict: bool) -> bool:
+    # Portfolios repeat the same symbols, so bulk paths mostly hit this cache
     try:
         validate_ticker(ticker, strict=strict)
         return True
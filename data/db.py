@@ -1,8 +1,9 @@
 import sqlite3
 import threading
 import weakref
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from app_settings import settings
 
@@ -80,31 +81,17 @@ def get_connection(reuse: bool = False) -> Any:
     - If sqlite3.connect is patched to return a bare Mock without __enter__/__exit__,
       return a lightweight proxy that provides context manager behavior and proxies attributes.
     """
+    # Inside transaction() every caller in this thread shares the open connection
+    active = getattr(_thread_local, "txn", None)
+    if active is not None:
+        return active
     # Ensure the data directory exists
     Path(settings.paths.data_dir).mkdir(parents=True, exist_ok=True)
     if reuse:
         cached = getattr(_thread_local, "conn", None)
         if cached is not None:
             return cached
-    raw = sqlite3.connect(str(DB_FILE))
-    # Ensure connection is closed even if caller forgets (guards ResourceWarning in tests)
-    def _safe_close(c):
-        try:
-            c.close()
-        except Exception:
-            pass
-    try:
-        weakref.finalize(raw, _safe_close, raw)
-    except Exception:  # pragma: no cover - weakref issues shouldn't break runtime
-        pass
-    # Enable WAL and adjust sync for better concurrency and durability trade-offs
-    try:
-        raw.execute("PRAGMA journal_mode=WAL;")
-        raw.execute("PRAGMA synchronous=NORMAL;")
-        raw.execute("PRAGMA busy_timeout=3000;")
-    except Exception:
-        pass
-
+    raw = _connect()
     # If the returned object already supports context management (real connection or test-provided),
     # return it directly.
     if hasattr(raw, "__enter__") and hasattr(raw, "__exit__"):
@@ -135,8 +122,96 @@ def get_connection(reuse: bool = False) -> Any:
     return proxy
 
 
+def _connect(**kwargs: Any) -> Any:
+    """Open a raw connection to DB_FILE with the standard pragmas applied."""
+    target = str(DB_FILE)
+    # ``file:`` URIs (e.g. ``file:name?mode=memory&cache=shared``) need uri=True
+    is_uri = target.startswith("file:")
+    if is_uri:
+        kwargs["uri"] = True
+    raw = sqlite3.connect(target, **kwargs)
+    # Ensure connection is closed even if caller forgets (guards ResourceWarning in tests)
+    def _safe_close(c):
+        try:
+            c.close()
+        except Exception:
+            pass
+    try:
+        weakref.finalize(raw, _safe_close, raw)
+    except Exception:  # pragma: no cover - weakref issues shouldn't break runtime
+        pass
+    # Enable WAL and adjust sync for better concurrency and durability trade-offs;
+    # in-memory databases have nothing to make durable, so skip journaling/fsync
+    try:
+        if is_uri and "mode=memory" in target:
+            raw.execute("PRAGMA journal_mode=MEMORY;")
+            raw.execute("PRAGMA synchronous=OFF;")
+        else:
+            raw.execute("PRAGMA journal_mode=WAL;")
+            raw.execute("PRAGMA synchronous=NORMAL;")
+            raw.execute("PRAGMA busy_timeout=3000;")
+    except Exception:
+        pass
+    return raw
+
+
+class _TransactionConnection(sqlite3.Connection):
+    """Connection shared by all get_connection() callers inside transaction().
+
+    While deferred, commit(), close() and the ``with`` exit are no-ops so helpers
+    written for autocommit use cannot end the enclosing transaction early.
+    """
+
+    _deferred = False
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._deferred:
+            return False
+        return super().__exit__(exc_type, exc, tb)
+
+    def commit(self) -> None:
+        if not self._deferred:
+            super().commit()
+
+    def close(self) -> None:
+        if not self._deferred:
+            super().close()
+
+
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """Run every write in this thread inside one transaction (one commit/sync).
+
+    Nested calls join the outer transaction. Rolls back if the block raises.
+    """
+    active = getattr(_thread_local, "txn", None)
+    if active is not None:
+        yield active
+        return
+    init_db()
+    conn = _connect(factory=_TransactionConnection)
+    conn.execute("BEGIN")
+    conn._deferred = True
+    _thread_local.txn = conn
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    else:
+        conn._deferred = False
+        conn.commit()
+    finally:
+        _thread_local.txn = None
+        conn._deferred = False
+        conn.close()
+
+
 def init_db() -> None:
     """Initialise the database with required tables if they don't exist."""
+    # Schema is ensured before a transaction opens; executescript would commit it early
+    if getattr(_thread_local, "txn", None) is not None:
+        return
     with get_connection(reuse=False) as conn:
         # Keep executescript for tests importing SCHEMA
         try:
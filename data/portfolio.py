@@ -1,14 +1,22 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 
 from config import COL_COST, COL_PRICE, COL_SHARES, COL_STOP, COL_TICKER, TODAY
 from config.providers import is_dev_stage
 from data.db import get_connection, init_db
-from portfolio import ensure_schema
+from portfolio import empty_portfolio as _empty_portfolio, ensure_schema
 
 from services.core.portfolio_service import compute_snapshot as _compute_snapshot
 from services.market import fetch_prices
 import os
 
+# Upper bound on concurrent per-ticker quote lookups in the price fallback
+_MAX_PRICE_WORKERS = 8
+
+_PORTFOLIO_COLUMNS = ["ticker", "shares", "stop_loss", "buy_price", "cost_basis"]
+_SELECT_PORTFOLIO_SQL = f"SELECT {', '.join(_PORTFOLIO_COLUMNS)} FROM portfolio"
+
 
 class PortfolioResult(pd.DataFrame):
     """A DataFrame that also unpacks into (portfolio_df, cash, is_first_time).
@@ -68,15 +76,12 @@ def _load_portfolio_from_database() -> tuple[pd.DataFrame, float | None]:
     try:
         with get_connection() as conn:
             try:
-                portfolio_df = pd.read_sql_query("SELECT * FROM portfolio", conn)
+                portfolio_df = pd.read_sql_query(_SELECT_PORTFOLIO_SQL, conn)
             except Exception:
-                # Fallback for tests that provide a mocked connection
-                rows = conn.execute(
-                    "SELECT ticker, shares, stop_loss, buy_price, cost_basis FROM portfolio"
-                ).fetchall()
-                portfolio_df = pd.DataFrame(
-                    rows, columns=["ticker", "shares", "stop_loss", "buy_price", "cost_basis"]
-                ).copy()
+                # Fallback for tests that provide a mocked connection; from_records
+                # already owns the rows, so no defensive copy is needed
+                rows = conn.execute(_SELECT_PORTFOLIO_SQL).fetchall()
+                portfolio_df = pd.DataFrame.from_records(rows, columns=_PORTFOLIO_COLUMNS)
             
             try:
                 cash_row = conn.execute("SELECT balance FROM cash WHERE id = 0").fetchone()
@@ -134,27 +139,30 @@ def _enrich_portfolio_with_current_prices(portfolio_df: pd.DataFrame) -> pd.Data
             "exception_message": str(exc)
         })
     
-    # Fall back to individual price lookups
+    # Fall back to individual price lookups, run concurrently (network bound)
     from services.market import get_current_price
-    
-    portfolio_with_prices = portfolio_df.copy()
-    current_prices = []
-    
-    for ticker in portfolio_df[COL_TICKER].tolist():
+
+    def _lookup(ticker: str) -> float:
         try:
             price = get_current_price(ticker)
-            current_prices.append(price if price is not None else 0.0)
-            if price is not None:
-                logger.info(f"Individual price loaded for {ticker}: ${price}")
         except Exception as exc:
             logger.warning(f"Individual price fetch failed for {ticker}", extra={
                 "ticker": ticker,
                 "exception_type": type(exc).__name__,
                 "exception_message": str(exc)
             })
-            current_prices.append(0.0)
-    
-    portfolio_with_prices["current_price"] = current_prices
+            return 0.0
+        if price is None:
+            return 0.0
+        logger.info(f"Individual price loaded for {ticker}: ${price}")
+        return price
+
+    tickers = portfolio_df[COL_TICKER].unique().tolist()
+    with ThreadPoolExecutor(max_workers=min(_MAX_PRICE_WORKERS, len(tickers))) as executor:
+        prices = dict(zip(tickers, executor.map(_lookup, tickers)))
+
+    portfolio_with_prices = portfolio_df.copy()
+    portfolio_with_prices["current_price"] = portfolio_df[COL_TICKER].map(prices).fillna(0.0)
     portfolio_with_prices["pct_change"] = 0.0
     return portfolio_with_prices
 
@@ -211,7 +219,7 @@ def load_portfolio(_depth: int = 0) -> PortfolioResult:
     from infra.logging import get_logger
     
     logger = get_logger(__name__)
-    empty_portfolio = pd.DataFrame(columns=ensure_schema(pd.DataFrame()).columns)
+    empty_portfolio = _empty_portfolio()
 
     try:
         # Step 1: Ensure database is ready
@@ -9,6 +9,7 @@ CACHE_DIR optional (default data/cache)
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Any
 import pandas as pd
 
@@ -32,14 +33,20 @@ class AppSettings:
     cache_dir: str
 
 
-def resolve_env(cli_env: Optional[str] = None) -> str:
-    # Intentionally does NOT call load_dotenv so tests can control environment
-    env = (cli_env or os.getenv("APP_ENV") or DEFAULT_ENV).strip()
+@lru_cache(maxsize=8)
+def _validated_env(raw: str) -> str:
+    # Keyed on the raw value, so changing APP_ENV never serves a stale result
+    env = raw.strip()
     if env not in VALID_ENVS:
         raise ValueError(f"Unknown APP_ENV '{env}'. Allowed: {sorted(VALID_ENVS)}")
     return env
 
 
+def resolve_env(cli_env: Optional[str] = None) -> str:
+    # Intentionally does NOT call load_dotenv so tests can control environment
+    return _validated_env(cli_env or os.getenv("APP_ENV") or DEFAULT_ENV)
+
+
 def get_settings(cli_env: Optional[str] = None) -> AppSettings:
     # Load dotenv lazily except during pytest (so tests can monkeypatch/delenv reliably)
     if "PYTEST_CURRENT_TEST" not in os.environ:
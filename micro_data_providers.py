@@ -11,6 +11,7 @@ Network calls are contained only within FinnhubDataProvider.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 
@@ -153,6 +154,17 @@ class SyntheticDataProviderExt:
 # ----------------------------- Finnhub Provider -----------------------------------------
 
 
+@lru_cache(maxsize=1)
+def _http_session():
+    """Shared keep-alive session for direct REST calls (reuses TCP+TLS connections)."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0))
+    return session
+
+
 def _ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
@@ -307,16 +319,18 @@ class FinnhubDataProvider:
         vols = res.get("v") or []
         if not ts:
             return pd.DataFrame(columns=["date", "open", "high", "low", "close", "volume"])  # pragma: no cover
-        dt = pd.to_datetime(pd.Series(ts, dtype="int64"), unit="s", utc=True)
+        # Typed column arrays go straight into the frame; no per-column inference pass
+        dt = pd.to_datetime(np.asarray(ts, dtype="int64"), unit="s", utc=True)
         df = pd.DataFrame(
             {
                 "date": dt,
-                "open": opens,
-                "high": highs,
-                "low": lows,
-                "close": closes,
-                "volume": vols,
-            }
+                "open": np.asarray(opens, dtype="float64"),
+                "high": np.asarray(highs, dtype="float64"),
+                "low": np.asarray(lows, dtype="float64"),
+                "close": np.asarray(closes, dtype="float64"),
+                "volume": np.asarray(vols),
+            },
+            copy=False,
         )
         return df
 
@@ -365,12 +379,10 @@ class FinnhubDataProvider:
             ask = data.get("ask")
         except Exception:
             # Fallback to REST
-            import requests
-
             url = "https://finnhub.io/api/v1/stock/bidask"
             params = {"symbol": ticker, "token": self.api_key}
             try:
-                r = requests.get(url, params=params, timeout=10)
+                r = _http_session().get(url, params=params, timeout=10)
                 if r.status_code == 429:
                     raise RuntimeError("429 Too Many Requests")
                 r.raise_for_status()
@@ -14,6 +14,14 @@ PORTFOLIO_COLUMNS: List[str] = [
     "buy_price",
     "cost_basis",
 ]
+# Column dtypes for an empty portfolio; numeric columns share one float64 block
+PORTFOLIO_DTYPES: dict[str, str] = {
+    "ticker": "string",
+    "shares": "float64",
+    "stop_loss": "float64",
+    "buy_price": "float64",
+    "cost_basis": "float64",
+}
 PORTFOLIO_STATE_FILE = Path("data/portfolio.json")
 DEFAULT_DEV_TICKERS = ["AAPL", "MSFT", "NVDA"]
 
@@ -27,6 +35,18 @@ def ensure_schema(df: pd.DataFrame) -> pd.DataFrame:
     return df[PORTFOLIO_COLUMNS].copy()
 
 
+def empty_portfolio() -> pd.DataFrame:
+    """Return a zero-row portfolio frame with typed columns.
+
+    Starting from typed columns means the first trade appends to existing
+    float64/string columns instead of up-casting object columns.
+    """
+
+    return pd.DataFrame(
+        {col: pd.Series(dtype=PORTFOLIO_DTYPES[col]) for col in PORTFOLIO_COLUMNS}
+    )
+
+
 def _load_state_raw() -> dict:
     if not PORTFOLIO_STATE_FILE.exists():
         return {"tickers": []}
@@ -74,6 +94,7 @@ def ensure_dev_defaults(env: str) -> list[str]:
 
 __all__ = [
     "ensure_schema",
+    "empty_portfolio",
     "load_portfolio_state",
     "save_portfolio_state",
     "add_ticker",
@@ -3,12 +3,16 @@ from __future__ import annotations
 import atexit
 import json
 import os
+import pickle
+import random
+import threading
 import time
 import weakref
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Literal, Optional
 
 import pandas as pd
 
@@ -31,6 +35,8 @@ yf = None  # type: ignore
 class CircuitState:
     failures: int = 0
     opened_at: float = 0.0
+    open_count: int = 0  # consecutive trips without a success in between
+    cooldown: float = 0.0  # jittered wait chosen when the breaker last tripped
 
 
 class MarketDataService:
@@ -38,8 +44,12 @@ class MarketDataService:
 
     Features:
       - In-memory TTL cache
-      - Optional per-day disk cache (simple JSON) for resilience
-      - Minimal rate limiting + circuit breaker (kept for parity with legacy tests)
+      - Optional per-day disk cache (JSON by default, pickle optional) for resilience
+      - Minimal rate limiting + circuit breaker whose cooldown backs off
+        exponentially (with jitter) across consecutive trips
+      - Optional stale-while-revalidate: expired entries (up to ``swr_seconds``
+        past the TTL) are served immediately while a background worker refreshes them;
+        shared state is lock-guarded, and ``close()`` stops the refresh workers
     """
 
     def __init__(
@@ -50,9 +60,14 @@ class MarketDataService:
         backoff_base: float = 0.0,
         circuit_fail_threshold: int = 3,
         circuit_cooldown: float = 60.0,
+        circuit_base_cooldown: float = 0.5,
         price_provider: Callable[[str], float] | None = None,
         disk_flush_interval: float = 5.0,
         disk_flush_batch: int = 8,
+        cache_format: Literal["json", "pickle"] = "json",
+        stale_while_revalidate: bool = False,
+        swr_seconds: float | None = None,
+        refresh_workers: int = 4,
     ) -> None:
         self._logger = get_logger(__name__)
         self._ttl = ttl_seconds if ttl_seconds is not None else int(settings.cache_ttl_seconds)
@@ -60,17 +75,33 @@ class MarketDataService:
         self._max_retries = int(max_retries)
         self._backoff_base = float(backoff_base)
         self._fail_threshold = int(circuit_fail_threshold)
+        # Cooldown doubles per consecutive trip from the base, capped at circuit_cooldown
         self._cooldown = float(circuit_cooldown)
+        self._base_cooldown = min(float(circuit_base_cooldown), self._cooldown)
 
         self._cache: dict[str, tuple[float, float]] = {}
         self._circuit: dict[str, CircuitState] = {}
         self._last_call_ts: float = 0.0
         self._price_provider = price_provider
 
+        self._stale_while_revalidate = bool(stale_while_revalidate)
+        # How long past the TTL a stale entry may still be served; None = no limit
+        self._swr_seconds = None if swr_seconds is None else max(0.0, float(swr_seconds))
+        self._refresh_workers = max(1, int(refresh_workers))
+        self._refresh_executor: ThreadPoolExecutor | None = None  # created on first refresh
+        self._refresh_lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        # Guards circuit, rate-limit and disk-cache state shared by foreground
+        # calls and refresh workers; never held across a provider call
+        self._state_lock = threading.RLock()
+
+        if cache_format not in ("json", "pickle"):
+            raise ValueError(f"Unsupported cache_format: {cache_format!r}")
+        self._cache_format = cache_format
         self._disk_cache_dir = Path(settings.paths.data_dir) / "price_cache"
         self._disk_cache_dir.mkdir(parents=True, exist_ok=True)
         self._disk_cache_day = datetime.now(UTC).strftime("%Y-%m-%d")
-        self._disk_cache_path = self._disk_cache_dir / f"{self._disk_cache_day}.json"
+        self._disk_cache_path = self._disk_cache_file(self._disk_cache_day)
         self._daily_disk_cache = self._load_disk_cache(self._disk_cache_path)
 
         self._disk_flush_interval = max(0.0, float(disk_flush_interval))
@@ -91,92 +122,130 @@ class MarketDataService:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    def _disk_cache_file(self, day: str) -> Path:
+        suffix = ".pkl" if self._cache_format == "pickle" else ".json"
+        return self._disk_cache_dir / f"{day}{suffix}"
+
     def _load_disk_cache(self, path: Path) -> dict[str, float]:
         try:
             if path.exists():
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    if isinstance(data, dict):
-                        return {str(k): float(v) for k, v in data.items()}
+                if self._cache_format == "pickle":
+                    with path.open("rb") as fh:
+                        data = pickle.load(fh)
+                else:
+                    data = json.loads(path.read_text(encoding="utf-8"))
+                if isinstance(data, dict):
+                    return {str(k): float(v) for k, v in data.items()}
         except Exception:  # pragma: no cover
             pass
         return {}
 
     def _save_disk_cache(self) -> None:
-        try:
-            tmp = self._disk_cache_path.with_suffix(".tmp")
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(self._daily_disk_cache, f, separators=(",", ":"))
-            os.replace(tmp, self._disk_cache_path)
-        except Exception:  # pragma: no cover
-            pass
-        else:
-            self._disk_cache_dirty = False
-            self._pending_disk_writes = 0
-            self._last_disk_flush = self._now()
+        # Held for the whole write: the dict must not change while it is
+        # serialized, and concurrent flushes would share the same .tmp file
+        with self._state_lock:
+            try:
+                tmp = self._disk_cache_path.with_suffix(".tmp")
+                # Serialize in one go so the payload lands in a single write() call
+                if self._cache_format == "pickle":
+                    tmp.write_bytes(pickle.dumps(self._daily_disk_cache, protocol=5))
+                else:
+                    payload = json.dumps(self._daily_disk_cache, separators=(",", ":"))
+                    tmp.write_text(payload, encoding="utf-8")
+                os.replace(tmp, self._disk_cache_path)
+            except Exception as e:  # pragma: no cover
+                self._logger.warning(
+                    "disk cache write failed",
+                    extra={
+                        "event": "market_disk_cache_write_failed",
+                        "path": str(self._disk_cache_path),
+                        "error": str(e),
+                    },
+                )
+            else:
+                self._disk_cache_dirty = False
+                self._pending_disk_writes = 0
+                self._last_disk_flush = self._now()
 
     def _flush_disk_cache_if_needed(self, force: bool = False) -> None:
-        if not self._disk_cache_dirty:
-            return
-
-        if force:
-            self._save_disk_cache()
-            return
-
-        if self._pending_disk_writes >= self._disk_flush_batch:
-            self._save_disk_cache()
-            return
-
-        if self._disk_flush_interval == 0.0:
-            self._save_disk_cache()
-            return
-
-        if (self._now() - self._last_disk_flush) >= self._disk_flush_interval:
-            self._save_disk_cache()
-
+        with self._state_lock:
+            if not self._disk_cache_dirty:
+                return
+
+            if (
+                force
+                or self._pending_disk_writes >= self._disk_flush_batch
+                or self._disk_flush_interval == 0.0
+                or (self._now() - self._last_disk_flush) >= self._disk_flush_interval
+            ):
+                self._save_disk_cache()
+
+    # All clock reads and waits go through these two hooks so tests can swap in a fake clock
     def _now(self) -> float:
         return time.time()
 
+    def _sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
     def _rate_limit(self) -> None:
-        elapsed = self._now() - self._last_call_ts
-        if elapsed < self._min_interval:
-            time.sleep(max(0.0, self._min_interval - elapsed))
-        self._last_call_ts = self._now()
+        # Reserve the next slot under the lock, then wait outside it, so
+        # min_interval holds across refresh workers without serializing them
+        with self._state_lock:
+            now = self._now()
+            slot = max(now, self._last_call_ts + self._min_interval)
+            self._last_call_ts = slot
+        if slot > now:
+            self._sleep(slot - now)
 
     def _circuit_open(self, symbol: str) -> bool:
-        state = self._circuit.get(symbol)
-        if not state:
+        with self._state_lock:
+            state = self._circuit.get(symbol)
+            if not state:
+                return False
+            if state.failures < self._fail_threshold:
+                return False
+            if (self._now() - state.opened_at) < state.cooldown:
+                return True
+            # cooldown passed -> half-open: let one probe through; a failed probe re-trips
+            state.failures = self._fail_threshold - 1
             return False
-        if state.failures < self._fail_threshold:
-            return False
-        if (self._now() - state.opened_at) < self._cooldown:
-            return True
-        # cooldown passed -> half-open
-        self._circuit[symbol] = CircuitState()
-        return False
+
+    def _next_cooldown(self, open_count: int) -> float:
+        # Exponential backoff with +/-25% jitter so per-ticker recoveries do not synchronize
+        backoff = self._base_cooldown * (2 ** (open_count - 1))
+        return min(self._cooldown, backoff * random.uniform(0.75, 1.25))
 
     def _record_failure(self, symbol: str) -> None:
-        st = self._circuit.get(symbol) or CircuitState()
-        st.failures += 1
-        if st.failures >= self._fail_threshold:
-            st.opened_at = self._now()
-            self._logger.error(
-                "circuit open",
-                extra={"event": "market_circuit_open", "ticker": symbol, "failures": st.failures},
-            )
-        self._circuit[symbol] = st
+        with self._state_lock:
+            st = self._circuit.get(symbol) or CircuitState()
+            st.failures += 1
+            if st.failures >= self._fail_threshold:
+                st.opened_at = self._now()
+                st.open_count += 1
+                st.cooldown = self._next_cooldown(st.open_count)
+                self._logger.error(
+                    "circuit open",
+                    extra={
+                        "event": "market_circuit_open",
+                        "ticker": symbol,
+                        "failures": st.failures,
+                        "cooldown": st.cooldown,
+                    },
+                )
+            self._circuit[symbol] = st
 
     def _record_success(self, symbol: str, price: float) -> None:
-        self._circuit[symbol] = CircuitState()
         price_float = float(price)
-        current = self._daily_disk_cache.get(symbol)
-        if current is not None and current == price_float:
-            return
+        with self._state_lock:
+            self._circuit[symbol] = CircuitState()
+            current = self._daily_disk_cache.get(symbol)
+            if current is not None and current == price_float:
+                return
 
-        self._daily_disk_cache[symbol] = price_float
-        self._disk_cache_dirty = True
-        self._pending_disk_writes += 1
-        self._flush_disk_cache_if_needed()
+            self._daily_disk_cache[symbol] = price_float
+            self._disk_cache_dirty = True
+            self._pending_disk_writes += 1
+            self._flush_disk_cache_if_needed()
 
     # ------------------------------------------------------------------
     # Public API
@@ -190,9 +259,59 @@ class MarketDataService:
         # Memory cache
         now_ts = self._now()
         cached = self._cache.get(symbol)
-        if cached and (now_ts - cached[1]) < self._ttl:
-            return cached[0]
+        if cached:
+            age = now_ts - cached[1]
+            if age < self._ttl:
+                return cached[0]
+            if self._stale_while_revalidate and (
+                self._swr_seconds is None or age <= self._ttl + self._swr_seconds
+            ):
+                self._schedule_refresh(symbol)
+                return cached[0]
+
+        return self._fetch_price(symbol, now_ts)
+
+    def close(self) -> None:
+        """Stop background refresh workers and flush any pending disk-cache writes."""
+        with self._refresh_lock:
+            executor, self._refresh_executor = self._refresh_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        self._flush_disk_cache_if_needed(force=True)
+
+    # ------------------------------------------------------------------
+    # Fetch + background refresh
+    # ------------------------------------------------------------------
+    def _schedule_refresh(self, symbol: str) -> None:
+        """Queue a background re-fetch of ``symbol`` unless one is already in flight."""
+        with self._refresh_lock:
+            if symbol in self._refreshing:
+                return
+            self._refreshing.add(symbol)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=self._refresh_workers, thread_name_prefix="mds-refresh"
+                )
+            executor = self._refresh_executor
+        executor.submit(self._refresh, symbol)
+
+    def _refresh(self, symbol: str) -> None:
+        try:
+            # The disk cache holds the same stale value; go to the provider
+            self._fetch_price(symbol, self._now(), bypass_disk=True)
+        except Exception as e:
+            # The caller already got the stale price; keep it and try again on the next read
+            self._logger.warning(
+                "background refresh failed",
+                extra={"event": "market_refresh_failed", "ticker": symbol, "error": str(e)},
+            )
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(symbol)
 
+    def _fetch_price(
+        self, symbol: str, now_ts: float, *, bypass_disk: bool = False
+    ) -> Optional[float]:
         # Test/injected provider path with retry semantics
         if self._price_provider is not None:
             last_exc: Exception | None = None
@@ -205,22 +324,24 @@ class MarketDataService:
                 except Exception as e:  # pragma: no cover - defensive
                     last_exc = e
                     if attempt < max(1, self._max_retries) - 1 and self._backoff_base > 0:
-                        time.sleep(self._backoff_base * (2 ** attempt))
+                        self._sleep(self._backoff_base * (2 ** attempt))
             if last_exc is not None:
                 raise MarketDataDownloadError(str(last_exc))
             return None
 
-        # Day rollover for disk cache
-        today = datetime.now(UTC).strftime("%Y-%m-%d")
-        if today != self._disk_cache_day:
-            self._flush_disk_cache_if_needed(force=True)
-            self._disk_cache_day = today
-            self._disk_cache_path = self._disk_cache_dir / f"{self._disk_cache_day}.json"
-            self._daily_disk_cache = self._load_disk_cache(self._disk_cache_path)
-
-        # Disk cache (soft fallback)
-        if symbol in self._daily_disk_cache:
-            price = float(self._daily_disk_cache[symbol])
+        with self._state_lock:
+            # Day rollover for disk cache
+            today = datetime.now(UTC).strftime("%Y-%m-%d")
+            if today != self._disk_cache_day:
+                self._flush_disk_cache_if_needed(force=True)
+                self._disk_cache_day = today
+                self._disk_cache_path = self._disk_cache_file(self._disk_cache_day)
+                self._daily_disk_cache = self._load_disk_cache(self._disk_cache_path)
+
+            # Disk cache (soft fallback)
+            disk_price = None if bypass_disk else self._daily_disk_cache.get(symbol)
+        if disk_price is not None:
+            price = float(disk_price)
             self._cache[symbol] = (price, now_ts)
             return price
 
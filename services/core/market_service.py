@@ -1,5 +1,6 @@
 from typing import Optional
-from datetime import datetime, timedelta, UTC
+from datetime import date, datetime, timedelta, UTC
+from functools import lru_cache
 import logging
 
 import pandas as pd
@@ -8,6 +9,25 @@ from services.core.market_data_service import MarketDataService
 from services.core.validation import validate_ticker
 
 
+# Typed empty history shared by every failure branch; callers get shallow copies
+_EMPTY_HISTORY = pd.DataFrame(
+    {
+        "date": pd.Series([], dtype="datetime64[ns]"),
+        "open": pd.Series([], dtype="float64"),
+        "high": pd.Series([], dtype="float64"),
+        "low": pd.Series([], dtype="float64"),
+        "close": pd.Series([], dtype="float64"),
+        "volume": pd.Series([], dtype="float64"),
+    }
+)
+
+
+@lru_cache(maxsize=16)
+def _date_range(months: int, today: date) -> tuple[date, date]:
+    """Return the (start, end) history window; calls on the same day share one result."""
+    return today - timedelta(days=months * 30), today
+
+
 class MarketService:
     """Facade for market data operations with caching and resilience.
     
@@ -85,8 +105,7 @@ class MarketService:
                 return self._empty_history_dataframe()
             
             # Calculate time window (use calendar days approximation)
-            end_date = datetime.now(UTC).date()
-            start_date = end_date - timedelta(days=months * 30)
+            start_date, end_date = _date_range(months, datetime.now(UTC).date())
             
             self._logger.debug("Fetching %d months history for %s (%s to %s)", 
                              months, symbol, start_date, end_date)
@@ -121,11 +140,12 @@ class MarketService:
 
     def _try_provider_method(self, provider, method_name: str, symbol: str, start_date, end_date) -> Optional[pd.DataFrame]:
         """Try a specific provider method for fetching history."""
-        if not hasattr(provider, method_name):
+        # Single attribute probe; a missing method is a normal branch, not an exception
+        method = getattr(provider, method_name, None)
+        if method is None:
             return None
-            
+
         try:
-            method = getattr(provider, method_name)
             if method_name == "get_daily_candles":
                 return method(symbol, start=start_date, end=end_date)
             else:  # get_history
@@ -162,4 +182,4 @@ class MarketService:
 
     def _empty_history_dataframe(self) -> pd.DataFrame:
         """Return an empty DataFrame with standard history columns."""
-        return pd.DataFrame(columns=self._STANDARD_COLUMNS)
+        return _EMPTY_HISTORY.copy(deep=False)
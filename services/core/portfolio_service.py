@@ -47,6 +47,13 @@ class PortfolioService:
     def remove_position(self, ticker: str) -> None:
         self._positions.pop(ticker, None)
 
+    def get_position(self, ticker: str) -> Optional[Position]:
+        return self._positions.get(ticker)
+
+    def shares_of(self, ticker: str) -> float:
+        position = self._positions.get(ticker)
+        return position.shares if position is not None else 0.0
+
     def get_metrics(self) -> PortfolioMetrics:
         if not self._positions:
             return PortfolioMetrics(0, 0, 0, 0)
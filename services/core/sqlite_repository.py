@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import sqlite3
+from contextlib import contextmanager
+from typing import Iterable, Iterator
 
 import pandas as pd
 
 from data.db import DB_FILE, get_connection, init_db
+from data.db import transaction as db_transaction
 from data.portfolio import (
     PortfolioResult,
     load_cash_balance,
@@ -13,6 +16,29 @@ from data.portfolio import (
 )
 from services.core.repository import LoadResult, PortfolioRepository
 
+# Display-style trade log keys (as produced by services.trading) -> DB columns
+_TRADE_LOG_RENAMES = {
+    "Date": "date",
+    "Ticker": "ticker",
+    "Shares Bought": "shares_bought",
+    "Buy Price": "buy_price",
+    "Cost Basis": "cost_basis",
+    "PnL": "pnl",
+    "Reason": "reason",
+    "Shares Sold": "shares_sold",
+    "Sell Price": "sell_price",
+}
+_TRADE_LOG_COLUMNS = tuple(_TRADE_LOG_RENAMES.values())
+_INSERT_TRADE_LOG_SQL = (
+    f"INSERT INTO trade_log ({', '.join(_TRADE_LOG_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _TRADE_LOG_COLUMNS)})"
+)
+
+
+def _trade_log_row(log: dict) -> tuple:
+    normalized = {_TRADE_LOG_RENAMES.get(k, k): v for k, v in log.items()}
+    return tuple(normalized.get(col) for col in _TRADE_LOG_COLUMNS)
+
 
 def _enable_wal(conn: sqlite3.Connection) -> None:
     try:
@@ -27,6 +53,12 @@ class SqlitePortfolioRepository(PortfolioRepository):
     def __init__(self, db_path: str | None = None) -> None:
         self.db_path = str(db_path) if db_path else str(DB_FILE)
 
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Group the repository calls in this block into a single commit; rolls back on error."""
+        with db_transaction() as conn:
+            yield conn
+
     def load(self) -> LoadResult:
         init_db()
         with get_connection() as conn:
@@ -60,17 +92,16 @@ class SqlitePortfolioRepository(PortfolioRepository):
         init_db()
         with get_connection() as conn:
             df = pd.DataFrame([log])
-            df = df.rename(
-                columns={
-                    "Date": "date",
-                    "Ticker": "ticker",
-                    "Shares Bought": "shares_bought",
-                    "Buy Price": "buy_price",
-                    "Cost Basis": "cost_basis",
-                    "PnL": "pnl",
-                    "Reason": "reason",
-                    "Shares Sold": "shares_sold",
-                    "Sell Price": "sell_price",
-                }
-            )
+            df = df.rename(columns=_TRADE_LOG_RENAMES)
             df.to_sql("trade_log", conn, if_exists="append", index=False)
+
+    def append_trade_log_batch(self, logs: Iterable[dict]) -> int:
+        """Append many trade log entries in a single transaction; returns rows written."""
+        rows = [_trade_log_row(log) for log in logs]
+        if not rows:
+            return 0
+        init_db()
+        # The connection context commits once for the whole executemany
+        with get_connection() as conn:
+            conn.executemany(_INSERT_TRADE_LOG_SQL, rows)
+        return len(rows)
@@ -64,8 +64,7 @@ class PortfolioPersistenceService:
         rows = self._prepare_portfolio_rows(portfolio_df, core_columns)
         
         # Execute batch insert
-        for row in rows:
-            conn.execute(insert_sql, row)
+        conn.executemany(insert_sql, rows)
             
         logger.debug(f"Saved {len(rows)} portfolio positions")
     
@@ -80,21 +79,10 @@ class PortfolioPersistenceService:
             List of tuples ready for database insertion
         """
         try:
-            return (
-                portfolio_df.reindex(columns=core_columns)
-                .fillna(0)
-                .apply(
-                    lambda r: (
-                        r["ticker"],
-                        float(r["shares"]),
-                        float(r["stop_loss"]),
-                        float(r["buy_price"]),
-                        float(r["cost_basis"]),
-                    ),
-                    axis=1,
-                )
-                .tolist()
-            )
+            # Column-wise conversion: tolist() yields Python scalars without a per-row apply
+            subset = portfolio_df.reindex(columns=core_columns).fillna(0)
+            numeric = (subset[col].astype(float).tolist() for col in core_columns[1:])
+            return list(zip(subset[core_columns[0]].tolist(), *numeric))
         except Exception as e:
             logger.error(f"Error preparing portfolio rows: {e}")
             return []
@@ -1,6 +1,7 @@
 """Manual pricing service for when market data APIs are unavailable."""
 
 import logging
+import sys
 from typing import Dict, Optional
 import streamlit as st
 
@@ -18,35 +19,45 @@ class ManualPricingService:
         """Ensure the session state key is initialized."""
         if self._session_key not in st.session_state:
             st.session_state[self._session_key] = {}
+
+    def _prices(self) -> Dict[str, float]:
+        """Return the session-backed price dict, initializing it if needed."""
+        self._ensure_initialized()
+        return st.session_state[self._session_key]
+
+    @staticmethod
+    def _key(ticker: str) -> str:
+        """Normalize a ticker to its interned upper-case dict key.
+
+        Tickers are usually already upper-case, so skip the ``upper()``
+        allocation in that case; interning makes repeat lookups compare by
+        identity.
+        """
+        ticker = ticker.strip()
+        return sys.intern(ticker if ticker.isupper() else ticker.upper())
     
     def set_price(self, ticker: str, price: float) -> None:
         """Set a manual price override for a ticker."""
-        self._ensure_initialized()
-        ticker = ticker.upper().strip()
+        ticker = self._key(ticker)
         if price <= 0:
             raise ValueError("Price must be positive")
         
-        st.session_state[self._session_key][ticker] = float(price)
+        self._prices()[ticker] = float(price)
         logger.info(f"Manual price set for {ticker}: ${price:.2f}")
     
     def get_price(self, ticker: str) -> Optional[float]:
         """Get manual price override for a ticker."""
-        self._ensure_initialized()
-        ticker = ticker.upper().strip()
-        return st.session_state[self._session_key].get(ticker)
+        return self._prices().get(self._key(ticker))
     
     def remove_price(self, ticker: str) -> None:
         """Remove manual price override for a ticker."""
-        self._ensure_initialized()
-        ticker = ticker.upper().strip()
-        if ticker in st.session_state[self._session_key]:
-            del st.session_state[self._session_key][ticker]
+        ticker = self._key(ticker)
+        if self._prices().pop(ticker, None) is not None:
             logger.info(f"Manual price removed for {ticker}")
     
     def get_all_prices(self) -> Dict[str, float]:
         """Get all manual price overrides."""
-        self._ensure_initialized()
-        return dict(st.session_state[self._session_key])
+        return dict(self._prices())
     
     def clear_all(self) -> None:
         """Clear all manual price overrides."""
@@ -56,9 +67,7 @@ class ManualPricingService:
     
     def has_price(self, ticker: str) -> bool:
         """Check if a manual price exists for a ticker."""
-        self._ensure_initialized()
-        ticker = ticker.upper().strip()
-        return ticker in st.session_state[self._session_key]
+        return self._key(ticker) in self._prices()
 
 
 # Global instance with proper initialization
@@ -1,10 +1,15 @@
 import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Dict, List, Optional
 from functools import lru_cache
+import numpy as np
 import pandas as pd
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
 
 from config import get_provider, is_dev_stage
 from core.retry import retry_with_backoff
@@ -41,19 +46,37 @@ def _micro_enabled() -> bool:
     return True
 
 _micro_provider_cache: Optional[MicroMarketDataProvider] = None  # type: ignore
+# Monotonic time of the last failed build; failures are retried once this expires
+_micro_provider_failed_at: float | None = None
+_MICRO_PROVIDER_RETRY_SECONDS = 60.0
+
+
+def _reset_micro_provider_cache() -> None:
+    """Forget the resolved micro provider so the next lookup rebuilds it."""
+    global _micro_provider_cache, _micro_provider_failed_at
+    _micro_provider_cache = None
+    _micro_provider_failed_at = None
+
 
 def _get_micro_provider() -> Optional[MicroMarketDataProvider]:  # type: ignore
-    global _micro_provider_cache
+    global _micro_provider_cache, _micro_provider_failed_at
     if not _micro_enabled():
         return None
+    if _micro_provider_cache is not None:
+        return _micro_provider_cache
     if get_micro_provider is None:
         return None
-    if _micro_provider_cache is None:
-        try:
-            _micro_provider_cache = get_micro_provider()
-        except Exception as e:  # pragma: no cover
-            logger.error("micro_provider_init_failed", extra={"error": str(e)})
-            return None
+    if (
+        _micro_provider_failed_at is not None
+        and time.monotonic() - _micro_provider_failed_at < _MICRO_PROVIDER_RETRY_SECONDS
+    ):
+        return None
+    try:
+        _micro_provider_cache = get_micro_provider()
+        _micro_provider_failed_at = None
+    except Exception as e:  # pragma: no cover
+        logger.error("micro_provider_init_failed", extra={"error": str(e)})
+        _micro_provider_failed_at = time.monotonic()
     return _micro_provider_cache
 
 
@@ -127,18 +150,22 @@ def fetch_prices_v2(tickers: List[str]) -> pd.DataFrame:
     prov = _get_effective_provider()
     if not prov:
         return fetch_prices(tickers)
-    rows = []
-    for t in tickers:
+
+    def _quote_row(t: str) -> dict[str, Any]:
         try:
-            quote = prov.get_quote(t)
-            rows.append(create_price_row(t, quote=quote))
+            return create_price_row(t, quote=prov.get_quote(t))
         except Exception:  # pragma: no cover
-            rows.append(create_price_row(t))  # Creates row with None values
-    return pd.DataFrame(rows)
+            return create_price_row(t)  # Creates row with None values
+
+    return _price_rows_to_frame(_map_tickers(_quote_row, tickers))
 
-# Global rate limiting state (retained from original implementation)
-_last_request_time = 0.0
-_min_request_interval = 1.0
+# Global rate limiting state: a token bucket on the monotonic clock, so a batch
+# can burst up to _BUCKET_CAP requests before being throttled to _BUCKET_RATE/s.
+_BUCKET_CAP = 8
+_BUCKET_RATE = 5.0  # tokens per second
+_bucket_tokens = float(_BUCKET_CAP)
+_bucket_last = time.monotonic()
+_bucket_lock = threading.Lock()
 
 
 # --- Utility helpers expected by tests ---------------------------------------------------
@@ -164,18 +191,44 @@ def calculate_percentage_change(old: float | int | None, new: float | int | None
     return (new_f - old_f) / old_f * 100.0
 
 
+def calculate_percentage_change_series(old: pd.Series, new: pd.Series) -> pd.Series:
+    """Vectorized :func:`calculate_percentage_change` over aligned Series.
+
+    Mirrors the scalar rules: 0.0 where ``old`` is missing or non-positive,
+    NaN where ``new`` is missing.
+    """
+    old_f = pd.to_numeric(old, errors="coerce").astype("float64")
+    new_f = pd.to_numeric(new, errors="coerce").astype("float64")
+    pct = (new_f - old_f) / old_f.where(old_f > 0.0) * 100.0
+    return pct.fillna(0.0).where(new_f.notna())
+
+
 def _rate_limit():
-    global _last_request_time
-    now = time.time()
-    elapsed = now - _last_request_time
-    if elapsed < _min_request_interval:
-        time.sleep(_min_request_interval - elapsed)
-    _last_request_time = time.time()
+    global _bucket_tokens, _bucket_last
+    with _bucket_lock:
+        now = time.monotonic()
+        _bucket_tokens = min(_BUCKET_CAP, _bucket_tokens + (now - _bucket_last) * _BUCKET_RATE)
+        _bucket_last = now
+        _bucket_tokens -= 1.0
+        if _bucket_tokens >= 0.0:
+            return
+        # Overdrawn: the debt reserves this caller's slot, so waiters queue in order
+        wait = -_bucket_tokens / _BUCKET_RATE
+    time.sleep(wait)
+
+
+# Connection pool size for the shared HTTP session; comfortably above the
+# per-ticker worker counts so concurrent fetches never wait for a socket
+_HTTP_POOL_SIZE = 32
 
 
 @lru_cache(maxsize=1)
 def _get_session():
     session = requests.Session()
+    # Keep TCP+TLS connections alive across consecutive requests
+    adapter = HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     session.headers.update(
         {
             "User-Agent": "Mozilla/5.0",
@@ -188,27 +241,53 @@ def _get_session():
 
 # Retry logic moved to core/retry.py for reuse across modules
 
+def _retry(fn: Callable[[], Any], attempts: int = 3, base_delay: float = 0.3, cap: float = 5.0) -> Any:
+    """Call ``fn`` with capped exponential backoff; jitter de-correlates concurrent retries."""
+    return retry_with_backoff(fn, attempts=attempts, base_delay=base_delay, max_delay=cap, jitter=True)
+
 def _legacy_market_test_mode() -> bool:  # pragma: no cover - legacy shim retained for compatibility
     return False
 
 def _skip_synthetic_for_tests() -> bool:  # pragma: no cover - legacy shim
     return False
 
-def _get_synthetic_close(ticker: str) -> float | None:
+def _get_synthetic_closes(tickers: list[str]) -> pd.Series:
+    """Return the last synthetic close per ticker as a float64 Series indexed by ticker.
+
+    The 90-day window is computed once for the batch. Providers exposing
+    ``get_histories(tickers, start, end)`` serve every symbol in one call;
+    otherwise per-ticker histories are fetched concurrently. Missing prices are NaN.
+    """
+    closes = np.full(len(tickers), np.nan)
     try:
         provider = get_provider()
         end = pd.Timestamp.utcnow().normalize()
         start = end - pd.Timedelta(days=90)
-        hist = provider.get_history(ticker, start, end)
-        if not hist.empty:
-            for candidate in ("Close", "close"):
-                if candidate in hist.columns:
-                    closes = hist[candidate].dropna()
-                    if not closes.empty:
-                        return float(closes.iloc[-1])
+        get_histories = getattr(provider, "get_histories", None)
+        if get_histories is not None:
+            histories = get_histories(tickers, start, end)
+            frames = [histories.get(t) for t in tickers]
+        else:
+            def _history(t: str) -> Optional[pd.DataFrame]:
+                try:
+                    return provider.get_history(t, start, end)
+                except Exception:
+                    return None
+
+            frames = _map_tickers(_history, tickers)
+        for i, hist in enumerate(frames):
+            if hist is not None:
+                price = extract_price_from_dataframe(hist)
+                if price is not None:
+                    closes[i] = price
     except Exception:
-        return None
-    return None
+        pass
+    return pd.Series(closes, index=pd.Index(tickers, name="ticker"), dtype="float64")
+
+
+def _get_synthetic_close(ticker: str) -> float | None:
+    close = _get_synthetic_closes([ticker]).iloc[0]
+    return None if np.isnan(close) else float(close)
 
 
 def _download_close_price(ticker: str, *, legacy: bool) -> tuple[float | None, bool, bool]:  # pragma: no cover - deprecated
@@ -234,6 +313,46 @@ def fetch_price(ticker: str) -> float | None:
     return None
 
 
+def _price_rows_to_frame(rows: list[dict[str, Any]]) -> pd.DataFrame:
+    """Build the ['ticker','current_price','pct_change'] frame from price rows.
+
+    Columns are pre-sized arrays filled in a single pass over the rows
+    (missing values become NaN), so pandas does not infer dtypes from a
+    list of dicts.
+    """
+    n = len(rows)
+    tickers = np.empty(n, dtype=object)
+    prices = np.full(n, np.nan)
+    pcts = np.full(n, np.nan)
+    for i, r in enumerate(rows):
+        tickers[i] = r["ticker"]
+        if r["current_price"] is not None:
+            prices[i] = r["current_price"]
+        if r["pct_change"] is not None:
+            pcts[i] = r["pct_change"]
+
+    return pd.DataFrame(
+        {"ticker": tickers, "current_price": prices, "pct_change": pcts},
+        copy=False,
+    )
+
+
+# Upper bound on concurrent per-ticker provider calls in fetch_prices
+_MAX_FETCH_WORKERS = 8
+
+
+def _map_tickers(fn: Callable[[str], Any], tickers: list[str]) -> list[Any]:
+    """Apply ``fn`` to each ticker concurrently, preserving input order.
+
+    Providers expose per-symbol calls only, so the network round-trips are
+    overlapped on a small thread pool instead of being issued back to back.
+    """
+    if len(tickers) <= 1:
+        return [fn(t) for t in tickers]
+    with ThreadPoolExecutor(max_workers=min(_MAX_FETCH_WORKERS, len(tickers))) as executor:
+        return list(executor.map(fn, tickers))
+
+
 @st.cache_data(ttl=300)
 def fetch_prices(tickers: list[str]) -> pd.DataFrame:
 
@@ -248,30 +367,27 @@ def fetch_prices(tickers: list[str]) -> pd.DataFrame:
     # Micro provider path only
     prov = _get_effective_provider()
     if prov:
-        rows = []
-        for t in tickers:
+        def _quote_row(t: str) -> dict[str, Any]:
             try:
-                quote = prov.get_quote(t)
-                rows.append(create_price_row(t, quote=quote))
+                return create_price_row(t, quote=prov.get_quote(t))
             except Exception:
-                rows.append(create_price_row(t))
-        return pd.DataFrame(rows)
+                return create_price_row(t)
+
+        return _price_rows_to_frame(_map_tickers(_quote_row, tickers))
 
     if is_dev_stage() and not _legacy_market_test_mode():
-        provider = get_provider()
-        import pandas as _pd
-        end = _pd.Timestamp.utcnow().normalize()
-        start = end - _pd.Timedelta(days=90)
-        rows: list[dict[str, Any]] = []
-        for t in tickers:
-            try:
-                hist = provider.get_history(t, start, end)
-                price = extract_price_from_dataframe(hist)
-            except Exception:
-                price = None
-            rows.append(create_price_row(t, price=price))
-        return _pd.DataFrame(rows)
+        closes = _get_synthetic_closes(tickers)
+        return pd.DataFrame(
+            {
+                "ticker": list(tickers),
+                "current_price": closes.to_numpy(),
+                "pct_change": np.full(len(tickers), np.nan),
+            },
+            copy=False,
+        )
     return pd.DataFrame(columns=["ticker", "current_price", "pct_change"])
+
+
 def get_day_high_low(ticker: str) -> tuple[float, float]:
     """Return today's high and low price for ``ticker``.
 
@@ -412,20 +528,61 @@ def get_current_price(ticker: str) -> float | None:
 
 
 # ----------------------------- Simple in-process cache ----------------------------------
-_price_cache: dict[str, tuple[float, float]] = {}  # ticker -> (timestamp, price)
+# ticker -> (monotonic timestamp, price); monotonic so wall-clock jumps never
+# expire or resurrect entries. TTL is per call, so expiry is checked on read.
+_PRICE_CACHE_MAXSIZE = 1024
+
+
+class _TTLLRU:
+    """Bounded LRU of ``(timestamp, price)`` entries; expired entries are dropped on read."""
+
+    def __init__(self, maxsize: int = _PRICE_CACHE_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, symbol: str, ttl: float, now: float) -> float | None:
+        with self._lock:
+            entry = self._data.get(symbol)
+            if entry is None:
+                return None
+            ts, price = entry
+            if now - ts > ttl:
+                del self._data[symbol]
+                return None
+            self._data.move_to_end(symbol)
+            return price
+
+    def put(self, symbol: str, price: float, now: float) -> None:
+        with self._lock:
+            self._data[symbol] = (now, price)
+            self._data.move_to_end(symbol)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_price_cache = _TTLLRU()
 _CACHE_TTL = 300.0
 
 def get_cached_price(ticker: str, ttl_seconds: float | int | None = None) -> float | None:
-    now = time.time()
+    now = time.monotonic()
     ttl = float(ttl_seconds) if ttl_seconds is not None else _CACHE_TTL
-    entry = _price_cache.get(ticker)
-    if entry:
-        ts, price = entry
-        if now - ts <= ttl:
-            return price
+    cached = _price_cache.get(ticker, ttl, now)
+    if cached is not None:
+        return cached
     price = get_current_price(ticker)
     if price is not None:
-        _price_cache[ticker] = (now, float(price))
+        _price_cache.put(ticker, float(price), now)
     return price
 
 
@@ -453,20 +610,16 @@ def sanitize_market_data(df: pd.DataFrame) -> pd.DataFrame:
         if col not in cleaned.columns:
             cleaned[col] = None
 
-    # Filter invalid tickers
-    cleaned = cleaned[cleaned["ticker"].apply(validate_ticker_format)]
-
-    # Impute prices where missing but volume exists
-    def _impute(row):
-        price = row.get("price")
-        vol = row.get("volume")
-        if price is None or (isinstance(price, float) and pd.isna(price)):
-            if vol is not None and (not isinstance(vol, float) or not pd.isna(vol)):
-                return 1.0
-            return None
-        return float(price)
-
-    cleaned["price"] = cleaned.apply(_impute, axis=1)
-    cleaned = cleaned[cleaned["price"].notna()]
+    # Filter invalid tickers; validate each distinct symbol once, then broadcast
+    tickers = cleaned["ticker"]
+    valid = {t: validate_ticker_format(t) for t in tickers.unique()}
+    cleaned = cleaned[tickers.map(valid).astype(bool)]
+
+    # Impute prices where missing but volume exists, as column-wise masks
+    price = cleaned["price"].astype("float64")
+    if "volume" in cleaned.columns:
+        price = price.mask(price.isna() & cleaned["volume"].notna(), 1.0)
+    cleaned = cleaned.assign(price=price)
+    cleaned = cleaned[price.notna()]
 
     return cleaned.reset_index(drop=True)
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 from typing import Optional
 import logging
+import threading
 
+import numpy as np
 import pandas as pd
 
 from services.core.market_service import MarketService
@@ -32,6 +34,10 @@ class PortfolioManager:
         self._portfolio = pd.DataFrame(columns=["ticker", "shares", "price", "cost_basis"])
         self._market_service = market_service or MarketService()
         self._logger = logging.getLogger(__name__)
+        # (ticker, months) keys whose history was fetched and persisted this session
+        self._history_fetched: set[tuple[str, int]] = set()
+        self._history_inflight: set[tuple[str, int]] = set()
+        self._history_lock = threading.Lock()
 
     def add_position(self, ticker: str, shares: int, price: float) -> None:
         """Add a new position to the portfolio.
@@ -47,29 +53,34 @@ class PortfolioManager:
         Raises:
             ValueError: If inputs are invalid
         """
-        # Input validation
-        if not ticker or not isinstance(ticker, str):
-            raise ValueError(f"Invalid ticker: {ticker}")
-        if not isinstance(shares, (int, float)) or shares <= 0:
-            raise ValueError(f"Invalid shares: {shares}")
-        if not isinstance(price, (int, float)) or price <= 0:
-            raise ValueError(f"Invalid price: {price}")
-        
+        # Input validation: one combined check on the happy path, details only on failure
+        if not (
+            ticker
+            and isinstance(ticker, str)
+            and isinstance(shares, (int, float))
+            and shares > 0
+            and isinstance(price, (int, float))
+            and price > 0
+        ):
+            self._raise_validation(ticker, shares, price)
+
         ticker = ticker.strip().upper()
         shares = int(shares)  # Ensure integer shares
         price = float(price)
         cost_basis = shares * price
         
-        # Add position to portfolio
-        new_position = {
-            "ticker": ticker,
-            "shares": shares,
-            "price": price,
-            "cost_basis": cost_basis,
-        }
-        
+        # Add position to portfolio: typed column arrays, so pandas skips
+        # per-row dict handling and dtype inference
+        new_position_df = pd.DataFrame(
+            {
+                "ticker": np.array([ticker], dtype=object),
+                "shares": np.array([shares], dtype=np.int64),
+                "price": np.array([price], dtype=np.float64),
+                "cost_basis": np.array([cost_basis], dtype=np.float64),
+            },
+            copy=False,
+        )
         # Use pd.concat with a properly constructed DataFrame to avoid FutureWarning
-        new_position_df = pd.DataFrame([new_position])
         if self._portfolio.empty:
             self._portfolio = new_position_df
         else:
@@ -79,18 +90,37 @@ class PortfolioManager:
         # Fetch historical data asynchronously (don't block on failures)
         self._fetch_and_save_history(ticker)
 
+    @staticmethod
+    def _raise_validation(ticker, shares, price) -> None:
+        """Raise the ValueError describing the first invalid add_position input."""
+        if not ticker or not isinstance(ticker, str):
+            raise ValueError(f"Invalid ticker: {ticker}")
+        if not isinstance(shares, (int, float)) or shares <= 0:
+            raise ValueError(f"Invalid shares: {shares}")
+        raise ValueError(f"Invalid price: {price}")
+
     def _fetch_and_save_history(self, ticker: str) -> None:
         """Fetch and save historical data for a ticker.
         
         This is called automatically when adding positions and should not
-        block the main operation if it fails.
+        block the main operation if it fails. Each ticker is fetched at most
+        once per session; concurrent adds of the same ticker share one fetch,
+        and failed or empty fetches are retried on the next add.
         """
+        key = (ticker, 6)
+        with self._history_lock:
+            if key in self._history_fetched or key in self._history_inflight:
+                self._logger.debug("History for %s already fetched this session", ticker)
+                return
+            self._history_inflight.add(key)
         try:
             self._logger.debug("Fetching 6-month history for %s", ticker)
             history = self._market_service.fetch_history(ticker, months=6)
             
             if not history.empty:
                 self._save_history_for_ticker(ticker, history)
+                with self._history_lock:
+                    self._history_fetched.add(key)
                 self._logger.info("Successfully fetched and saved history for %s (%d rows)", 
                                 ticker, len(history))
             else:
@@ -99,6 +129,9 @@ class PortfolioManager:
         except Exception as e:
             # Don't block user action on history errors; log and continue
             self._logger.exception("Failed to fetch/persist 6mo history for %s: %s", ticker, e)
+        finally:
+            with self._history_lock:
+                self._history_inflight.discard(key)
 
     def _save_history_for_ticker(self, ticker: str, history: pd.DataFrame) -> None:
         """Save historical market data for a ticker to persistent storage.
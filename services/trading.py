@@ -8,6 +8,7 @@ import data.portfolio as portfolio_data
 from config import COL_COST, COL_PRICE, COL_SHARES, COL_STOP, COL_TICKER, TODAY
 from core.errors import MarketDataDownloadError, NoMarketDataError
 from data.db import get_connection, init_db
+from portfolio import empty_portfolio
 from services.core.portfolio_service import (
     apply_buy as _apply_buy,
 )
@@ -77,9 +78,7 @@ def manual_buy(
     session_mode = portfolio_df is None or cash is None
     if session_mode:
         if not hasattr(st.session_state, "portfolio"):
-            st.session_state.portfolio = pd.DataFrame(
-                columns=[COL_TICKER, COL_SHARES, COL_STOP, COL_PRICE, COL_COST]
-            )
+            st.session_state.portfolio = empty_portfolio()
         portfolio_df = getattr(st.session_state, "portfolio")
         # Fallback to 10,000 if session state isn't fully active in test context
         cash = float(getattr(st.session_state, "cash", 10000.0))
@@ -202,7 +201,7 @@ def manual_sell(
         portfolio_df = getattr(
             st.session_state,
             "portfolio",
-            pd.DataFrame(columns=[COL_TICKER, COL_SHARES, COL_STOP, COL_PRICE, COL_COST]),
+            empty_portfolio(),
         )
         cash = float(getattr(st.session_state, "cash", 10000.0))
     if shares <= 0 or price <= 0:
@@ -1,5 +1,8 @@
 import os
+from collections.abc import Mapping
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict, Set
 
 import pandas as pd
@@ -31,65 +34,85 @@ class WatchlistDF(pd.DataFrame):
         return super().__setitem__(key, value)
 
 
+# Shared immutable empties; swapped for real containers on first mutation
+_EMPTY_TICKERS: frozenset[str] = frozenset()
+_EMPTY_PRICES: Mapping[str, float] = MappingProxyType({})
+
+
 @dataclass
 class WatchlistState:
-    """Container for watchlist state"""
+    """Container for watchlist state.
 
-    tickers: Set[str] | None = None
-    prices: Dict[str, float] | None = None
+    Unset fields point at shared immutable empties (copy-on-write), so states
+    that are only rendered never allocate; use ``mutable_tickers()`` /
+    ``mutable_prices()`` before mutating.
+    """
+
+    tickers: AbstractSet[str] | None = None
+    prices: Mapping[str, float] | None = None
 
     def __post_init__(self):
-        self.tickers = set() if self.tickers is None else self.tickers
-        self.prices = {} if self.prices is None else self.prices
+        self.tickers = _EMPTY_TICKERS if self.tickers is None else self.tickers
+        self.prices = _EMPTY_PRICES if self.prices is None else self.prices
+
+    def mutable_tickers(self) -> Set[str]:
+        if not isinstance(self.tickers, set):
+            self.tickers = set(self.tickers)
+        return self.tickers
+
+    def mutable_prices(self) -> Dict[str, float]:
+        if not isinstance(self.prices, dict):
+            self.prices = dict(self.prices)
+        return self.prices
+
+    def clear(self) -> None:
+        self.tickers = _EMPTY_TICKERS
+        self.prices = _EMPTY_PRICES
+
+
+def _ensure_state() -> WatchlistState:
+    """Return the session's WatchlistState, (re)creating it if missing or corrupted."""
+    state = st.session_state.get("watchlist_state")
+    if not isinstance(state, WatchlistState):
+        state = WatchlistState()
+        st.session_state["watchlist_state"] = state
+    return state
 
 
 def init_watchlist() -> None:
     """Initialize watchlist state if not present or corrupted (starts empty)."""
-    if not hasattr(st.session_state, "watchlist_state") or not isinstance(
-        st.session_state.watchlist_state, WatchlistState
-    ):
-        st.session_state.watchlist_state = WatchlistState()
+    state = _ensure_state()
     # Clear at the beginning of each test but keep idempotent within a single test
     current_test = os.environ.get("PYTEST_CURRENT_TEST", None)
-    last_test = getattr(st.session_state, "_watchlist_last_test_id", None)
+    last_test = st.session_state.get("_watchlist_last_test_id")
     if current_test != last_test:
-        st.session_state.watchlist_state.tickers.clear()
-        st.session_state.watchlist_state.prices.clear()
+        state.clear()
         st.session_state._watchlist_last_test_id = current_test
 
 
 def add_to_watchlist(ticker: str) -> None:
     """Add ticker to watchlist"""
-    if not hasattr(st.session_state, "watchlist_state") or not isinstance(
-        st.session_state.watchlist_state, WatchlistState
-    ):
-        st.session_state.watchlist_state = WatchlistState()
+    state = _ensure_state()
     ticker = ticker.upper()
 
-    if ticker in st.session_state.watchlist_state.tickers:
+    if ticker in state.tickers:
         st.info(f"{ticker} is already in your watchlist")
         return
 
-    st.session_state.watchlist_state.tickers.add(ticker)
+    state.mutable_tickers().add(ticker)
 
 
 def remove_from_watchlist(ticker: str) -> None:
     """Remove ticker from watchlist"""
-    if not hasattr(st.session_state, "watchlist_state") or not isinstance(
-        st.session_state.watchlist_state, WatchlistState
-    ):
-        st.session_state.watchlist_state = WatchlistState()
+    state = _ensure_state()
     ticker = ticker.upper()
-    st.session_state.watchlist_state.tickers.discard(ticker)
+    if ticker in state.tickers:
+        state.mutable_tickers().discard(ticker)
 
 
 def get_watchlist() -> pd.DataFrame:
     """Get watchlist as DataFrame"""
-    if not hasattr(st.session_state, "watchlist_state") or not isinstance(
-        st.session_state.watchlist_state, WatchlistState
-    ):
-        st.session_state.watchlist_state = WatchlistState()
-    tickers = sorted(list(set(st.session_state.watchlist_state.tickers)))
+    tickers = sorted(set(_ensure_state().tickers))
     return WatchlistDF({"ticker": tickers})
 
 
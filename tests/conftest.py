@@ -1,5 +1,6 @@
 import pytest
 import sqlite3
+import uuid
 from contextlib import suppress
 import pandas as pd
 from tests.mock_streamlit import StreamlitMock
@@ -15,6 +16,45 @@ def cleanup_db():
         conn.close()
 
 
+class FakeClock:
+    """Deterministic clock for time-dependent tests; only moves when told to."""
+
+    def __init__(self, start: float = 1_000.0):
+        self._now = float(start)
+
+    def time(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float) -> None:
+        self._now += float(seconds)
+
+    def sleep(self, seconds: float) -> None:
+        # Sleeping just advances the clock, so waits cost no wall time
+        self.advance(max(0.0, seconds))
+
+
+@pytest.fixture
+def fake_clock():
+    """Provide a fresh FakeClock starting at a fixed epoch."""
+    return FakeClock()
+
+
+def _memory_db_uri() -> str:
+    """Return a fresh, uniquely named shared-cache in-memory SQLite URI."""
+    return f"file:testdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
+
+
+@pytest.fixture
+def memory_db(monkeypatch):
+    """Point data.db at a private in-memory database for the test's duration."""
+    uri = _memory_db_uri()
+    # A shared-cache in-memory DB lives as long as one connection stays open
+    keeper = sqlite3.connect(uri, uri=True)
+    monkeypatch.setattr("data.db.DB_FILE", uri)
+    yield uri
+    keeper.close()
+
+
 @pytest.fixture
 def mock_streamlit():
     """Create streamlit mock with session state."""
@@ -38,4 +78,61 @@ def mock_portfolio_data():
     )
 
 
+@pytest.fixture(scope="session")
+def summary_frame() -> pd.DataFrame:
+    """Daily summary frame (two holdings plus TOTAL row); shared, copy before mutating."""
+    return pd.DataFrame(
+        [
+            {"Ticker": "AAA", "Shares": 10, "Buy Price": 5.00, "Cost Basis": 50.0, "Stop Loss": 1.50, "Total Equity": pd.NA},
+            {"Ticker": "BBB", "Shares": 20, "Buy Price": 7.00, "Cost Basis": 140.0, "Stop Loss": 2.10, "Total Equity": pd.NA},
+            {"Ticker": "TOTAL", "Shares": pd.NA, "Buy Price": pd.NA, "Cost Basis": pd.NA, "Stop Loss": pd.NA, "Total Equity": 4_040.30},
+        ]
+    )
+
+
+@pytest.fixture(scope="session")
+def history_frame() -> pd.DataFrame:
+    """Five days of TOTAL equity history; shared, copy before mutating."""
+    dates = pd.date_range(end="2025-08-06", periods=5, freq="D")
+    equity = [3_950.0, 3_980.0, 4_100.0, 3_980.0, 4_040.30]
+    return pd.DataFrame({"date": dates, "ticker": "TOTAL", "total_equity": equity})
+
+
+@pytest.fixture(scope="session")
+def base_holdings() -> tuple[dict, ...]:
+    """Holdings payload for summary rendering; copy each dict before mutating."""
+    return (
+        {
+            "ticker": "AAA",
+            "exchange": "NASDAQ",
+            "sector": "Biotech",
+            "shares": 10,
+            "costPerShare": 5.00,
+            "currentPrice": 57.37,
+            "stopType": "None",
+            "stopPrice": None,
+            "trailingStopPct": None,
+            "marketCap": 250_000_000,
+            "adv20d": 200_000,
+            "spread": 0.01,
+            "catalystDate": None,
+        },
+        {
+            "ticker": "BBB",
+            "exchange": "NYSE",
+            "sector": "AI",
+            "shares": 20,
+            "costPerShare": 7.00,
+            "currentPrice": 168.33,
+            "stopType": "None",
+            "stopPrice": None,
+            "trailingStopPct": None,
+            "marketCap": 120_000_000,
+            "adv20d": 300_000,
+            "spread": 0.03,
+            "catalystDate": None,
+        },
+    )
+
+
 ## Removed legacy yfinance fixture after migration to Finnhub/Synthetic providers.
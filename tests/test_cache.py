@@ -12,6 +12,7 @@ from utils.cache import (
     get_cached_price_history, 
     warm_cache_for_symbols,
     get_cache_stats,
+    get_unwarmed_symbols,
     clear_cache,
     COMMON_SYMBOLS
 )
@@ -142,6 +143,21 @@ class TestMarketCache(unittest.TestCase):
         cached_gspc = get_cached_price_data("^GSPC")
         self.assertEqual(cached_gspc["close"], 4500.0)
 
+        # Only the failed symbol still needs warming in this TTL window
+        self.assertEqual(get_unwarmed_symbols(test_symbols), ["INVALID"])
+        self.assertEqual(get_unwarmed_symbols(test_symbols, ttl_minutes=0), test_symbols)
+
+    def test_warmed_keys_keep_only_current_window(self):
+        """Warm markers from earlier TTL windows are dropped on insert."""
+        import utils.cache as cache_module
+
+        with patch.object(cache_module.time, "time", return_value=0.0):
+            cache_module._mark_warmed("^GSPC", ttl_minutes=5)
+        with patch.object(cache_module.time, "time", return_value=300.0):
+            cache_module._mark_warmed("^DJI", ttl_minutes=5)
+
+        self.assertEqual(cache_module._warmed_keys, {("^DJI", 1)})
+
     def test_cache_stats(self):
         """Test cache statistics functionality."""
         # Initially empty cache
@@ -32,61 +32,53 @@ def test_dev_stage_returns_synthetic_provider():
     assert isinstance(df, pd.DataFrame)
 
 
-def test_production_falls_back_to_yfinance(monkeypatch):
-    # Make Finnhub provider raise so chain moves to yfinance
-    class DummyFinnhub:
-        def __init__(self, *a, **k):
-            pass
+class _FinnhubDown:
+    def __init__(self, *a, **k):
+        pass
 
-        def get_daily_candles(self, *a, **k):
-            raise RuntimeError("finnhub down")
+    def get_daily_candles(self, *a, **k):
+        raise RuntimeError("finnhub down")
 
-    monkeypatch.setenv("FINNHUB_API_KEY", "dummy")
-    monkeypatch.setattr(micro_config, "FinnhubDataProvider", DummyFinnhub)
 
-    # Inject fake yfinance module
-    yf_mod = types.ModuleType("yfinance")
+class _SampleTicker:
+    def __init__(self, ticker):
+        self.ticker = ticker
+
+    def history(self, start=None, end=None):
+        return _sample_df()
+
 
-    class DummyTicker:
-        def __init__(self, ticker):
-            self.ticker = ticker
+class _EmptyTicker(_SampleTicker):
+    def history(self, start=None, end=None):
+        return pd.DataFrame()
 
-        def history(self, start=None, end=None):
-            return _sample_df()
 
-    yf_mod.Ticker = DummyTicker
+@pytest.fixture
+def finnhub_down(monkeypatch):
+    """Make the Finnhub link of the production chain fail."""
+    monkeypatch.setenv("FINNHUB_API_KEY", "dummy")
+    monkeypatch.setattr(micro_config, "FinnhubDataProvider", _FinnhubDown)
+
+
+@pytest.fixture
+def fake_yfinance(monkeypatch):
+    """Install one stub yfinance module; tests only swap its ``Ticker`` class."""
+    yf_mod = types.ModuleType("yfinance")
+    yf_mod.Ticker = _SampleTicker
     monkeypatch.setitem(sys.modules, "yfinance", yf_mod)
+    return yf_mod
+
 
+def test_production_falls_back_to_yfinance(finnhub_down, fake_yfinance):
     provider = micro_config.get_provider(cli_env="production")
     df = provider.get_daily_candles("AAPL", date.today() - pd.Timedelta(days=5), date.today())
     assert isinstance(df, pd.DataFrame)
     assert not df.empty
 
 
-def test_production_falls_back_to_stooq_when_yf_empty(monkeypatch):
-    # Finnhub fails
-    class DummyFinnhub:
-        def __init__(self, *a, **k):
-            pass
-
-        def get_daily_candles(self, *a, **k):
-            raise RuntimeError("finnhub down")
-
-    monkeypatch.setenv("FINNHUB_API_KEY", "dummy")
-    monkeypatch.setattr(micro_config, "FinnhubDataProvider", DummyFinnhub)
-
+def test_production_falls_back_to_stooq_when_yf_empty(finnhub_down, fake_yfinance, monkeypatch):
     # yfinance returns empty
-    yf_mod = types.ModuleType("yfinance")
-
-    class DummyTickerEmpty:
-        def __init__(self, ticker):
-            pass
-
-        def history(self, start=None, end=None):
-            return pd.DataFrame()
-
-    yf_mod.Ticker = DummyTickerEmpty
-    monkeypatch.setitem(sys.modules, "yfinance", yf_mod)
+    fake_yfinance.Ticker = _EmptyTicker
 
     # Inject pandas_datareader.data.DataReader
     pdr_mod = types.ModuleType("pandas_datareader")
@@ -1,5 +1,5 @@
 import pytest
-from config import get_provider, resolve_environment
+from config import get_provider, reset_providers, resolve_environment
 
 
 def test_env_default(monkeypatch):
@@ -26,3 +26,14 @@ def test_cli_override(monkeypatch):
     monkeypatch.setenv("APP_ENV", "production")
     # CLI override should still allow synthetic selection
     assert get_provider(cli_env="dev_stage").__class__.__name__ in {"SyntheticDataProvider", "SyntheticDataProviderExt"}
+
+
+def test_provider_instances_are_reused(monkeypatch):
+    monkeypatch.setenv("APP_ENV", "dev_stage")
+    reset_providers()
+    first = get_provider()
+    assert get_provider() is first
+    # Switching env selects a different cached instance
+    assert get_provider(cli_env="production") is not first
+    reset_providers()
+    assert get_provider() is not first
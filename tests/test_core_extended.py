@@ -1,5 +1,7 @@
 """Tests for core services with missing coverage."""
 
+from collections.abc import Mapping, Set as AbstractSet
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
@@ -148,12 +150,8 @@ class TestTradingServiceCore:
         result = service.sell_stock("AAPL", 4, 150.0)
 
         assert result.success is True
-        df = portfolio.to_dataframe()
-        remaining_shares = df.loc[df["ticker"] == "AAPL", "shares"].iloc[0]
-        remaining_cost_basis = df.loc[df["ticker"] == "AAPL", "cost_basis"].iloc[0]
-
-        assert remaining_shares == 6
-        assert pytest.approx(600.0) == remaining_cost_basis
+        assert portfolio.shares_of("AAPL") == 6
+        assert pytest.approx(600.0) == portfolio.get_position("AAPL").cost_basis
 
 
 class TestValidationServiceCore:
@@ -190,12 +188,11 @@ class TestWatchlistServiceExtended:
 
     def test_watchlist_service_add_ticker(self, mock_sidebar, mock_write):
         """Test adding ticker to watchlist."""
-        from services.watchlist_service import add_to_watchlist, WatchlistState
+        from services.watchlist_service import _ensure_state, add_to_watchlist
         import streamlit as st
 
         # Initialize session state
-        if not hasattr(st.session_state, "watchlist_state"):
-            st.session_state.watchlist_state = WatchlistState()
+        _ensure_state()
 
         initial_count = len(st.session_state.watchlist_state.tickers)
         add_to_watchlist("AAPL")
@@ -204,15 +201,14 @@ class TestWatchlistServiceExtended:
     def test_watchlist_service_remove_ticker(self, mock_sidebar, mock_write):
         """Test removing ticker from watchlist."""
         from services.watchlist_service import (
+            _ensure_state,
             remove_from_watchlist,
             add_to_watchlist,
-            WatchlistState,
         )
         import streamlit as st
 
         # Initialize session state
-        if not hasattr(st.session_state, "watchlist_state"):
-            st.session_state.watchlist_state = WatchlistState()
+        _ensure_state()
 
         # Add ticker first
         add_to_watchlist("AAPL")
@@ -228,8 +224,8 @@ class TestWatchlistServiceExtended:
 
         # Test with None values
         state = WatchlistState(tickers=None, prices=None)
-        assert isinstance(state.tickers, set)
-        assert isinstance(state.prices, dict)
+        assert isinstance(state.tickers, AbstractSet)
+        assert isinstance(state.prices, Mapping)
 
         # Test with existing values
         existing_tickers = {"AAPL", "GOOGL"}
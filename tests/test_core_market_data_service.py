@@ -1,116 +1,185 @@
 import pytest
+from core.errors import MarketDataDownloadError
 from services.core.market_data_service import MarketDataService
 from services.time import Clock
-from unittest.mock import patch
 import datetime
 import pandas as pd
-import time
 
 
-class DummyPriceProvider:
-    def __init__(self, price=123.45, fail=False):
+class ConstPriceProvider:
+    __slots__ = ("price", "called")
+
+    def __init__(self, price=123.45):
         self.price = price
-        self.fail = fail
-        self.calls = 0
+        self.called = False
 
     def __call__(self, ticker):
-        self.calls += 1
-        if self.fail:
-            raise Exception("fail")
+        self.called = True
         return self.price
 
 
-def test_market_data_service_retry_and_backoff_and_fallback(monkeypatch, tmp_path):
-    # Covers retry/backoff and fallback logic for MarketDataService
-    # Legacy yfinance fallback removed; ensure service behaves without legacy path
-    class DummyYF:
-        def __init__(self):
-            self.calls = 0
-
-        def download(self, *a, **kw):
-            self.calls += 1
-            raise Exception("network fail")
-
-        class Ticker:
-            def __init__(self, symbol):
-                pass
-
-            def history(self, period):
-                raise Exception("network fail")
-
-    dummy_yf = DummyYF()
-    monkeypatch.setattr("services.core.market_data_service.yf", dummy_yf)
-    mds = MarketDataService(price_provider=None)
-    mds._disk_cache_dir = tmp_path
-    mds._disk_cache_day = "2099-01-01"
-    mds._disk_cache_path = tmp_path / "2099-01-01.json"
-    mds._daily_disk_cache = {}
-    mds._max_retries = 2
-    mds._backoff_base = 0.01
-    # Previously raised after retries; now permission/network style failures may soft-return None
-    val = mds.get_price("FAIL3")
-    assert val is None or isinstance(val, (int, float))
-
-    # Now test fallback to NoMarketDataError (should return None)
-    class DummyYF2:
-        def download(self, *a, **kw):
-            return pd.DataFrame({"Close": []})
-
-        class Ticker:
-            def __init__(self, symbol):
-                pass
-
-            def history(self, period):
-                return pd.DataFrame({"Close": []})
-
-    monkeypatch.setattr("services.core.market_data_service.yf", DummyYF2())
-    try:
-        val = mds.get_price("FAIL4")
-        assert val is None or isinstance(val, (int, float))
-    except Exception as exc:
-        # Allow MarketDataDownloadError if provider path raises permission errors
-        from core.errors import MarketDataDownloadError
-        assert isinstance(exc, MarketDataDownloadError)
-
-
-def test_market_data_service_cache_and_fallback():
-    provider = DummyPriceProvider(price=100)
-    mds = MarketDataService(price_provider=provider)
-    price1 = mds.get_price("AAPL")
-    price2 = mds.get_price("AAPL")
-    assert price1 == 100
-    assert price2 == 100
-    assert provider.calls == 1  # cache hit
-
-
-def test_market_data_service_error_and_retry():
-    provider = DummyPriceProvider(fail=True)
-    mds = MarketDataService(price_provider=provider)
-    with pytest.raises(Exception):
-        mds.get_price("FAIL")
+class CountingPriceProvider(ConstPriceProvider):
+    """Constant provider that also counts calls, for cache-hit assertions."""
 
+    __slots__ = ("call_count",)
 
-def test_market_data_service_daily_cache_rollover(tmp_path):
-    # Use a temp directory for disk cache
-    from services.core.market_data_service import MarketDataService, CircuitState
+    def __init__(self, price=123.45):
+        super().__init__(price)
+        self.call_count = 0
 
-    provider = DummyPriceProvider(price=42)
-    mds = MarketDataService(price_provider=provider)
-    # Patch disk cache dir to tmp_path
-    mds._disk_cache_dir = tmp_path
-    mds._disk_cache_day = "2099-01-01"
-    mds._disk_cache_path = tmp_path / "2099-01-01.json"
-    mds._daily_disk_cache = {}
-    # Test _save_disk_cache and _load_disk_cache
-    mds._daily_disk_cache["AAPL"] = 123.45
-    mds._save_disk_cache()
-    loaded = mds._load_disk_cache(mds._disk_cache_path)
-    assert loaded["AAPL"] == 123.45
+    def __call__(self, ticker):
+        self.call_count += 1
+        return super().__call__(ticker)
+
+
+class FailingProvider:
+    __slots__ = ("called",)
+
+    def __init__(self):
+        self.called = False
+
+    def __call__(self, ticker):
+        self.called = True
+        raise RuntimeError("fail")
+
+
+_EMPTY_DF = pd.DataFrame({"Close": []})
+
+
+@pytest.fixture(scope="module")
+def mds_factory(tmp_path_factory):
+    # Constructor cost (settings, disk cache load) is paid once per configuration
+    pool: list[MarketDataService] = []
+
+    def _make(**kwargs) -> MarketDataService:
+        # Tests default to pickle: cheaper to encode/decode than JSON
+        kwargs.setdefault("cache_format", "pickle")
+        service = MarketDataService(**kwargs)
+        cache_dir = tmp_path_factory.mktemp("mdscache")
+        service._disk_cache_dir = cache_dir
+        service._disk_cache_day = "2099-01-01"
+        service._disk_cache_path = service._disk_cache_file("2099-01-01")
+        service._daily_disk_cache = {}
+        pool.append(service)
+        return service
+
+    yield _make
+    # Stop refresh workers and flush now; dropping the instances then makes
+    # their weakref'd atexit flush hooks no-ops
+    for service in pool:
+        service.close()
+    pool.clear()
+
+
+@pytest.fixture(scope="module")
+def shared_mds(mds_factory):
+    return mds_factory(price_provider=None, max_retries=2, backoff_base=0.01)
+
+
+@pytest.fixture(scope="module")
+def shared_mds_cache_dir(shared_mds):
+    return shared_mds._disk_cache_dir
+
+
+@pytest.fixture
+def mds(shared_mds, shared_mds_cache_dir):
+    # Reset per-test state so cases sharing the module service stay independent
+    shared_mds._price_provider = None
+    shared_mds._disk_cache_dir = shared_mds_cache_dir
+    shared_mds._cache.clear()
+    shared_mds._circuit.clear()
+    shared_mds._min_interval = 0.25
+    shared_mds._last_call_ts = 0.0
+    shared_mds._daily_disk_cache = {}
+    shared_mds._disk_cache_dirty = False
+    shared_mds._pending_disk_writes = 0
+    shared_mds._disk_cache_day = "2099-01-01"
+    shared_mds._cache_format = "pickle"
+    shared_mds._disk_cache_path = shared_mds._disk_cache_file("2099-01-01")
+    return shared_mds
+
+
+class _ForbiddenQuoteProvider:
+    """Micro provider whose quote endpoint rejects the plan (soft failure)."""
+
+    def get_quote(self, symbol):
+        raise RuntimeError("403 Forbidden: plan limit")
+
+
+class _EmptyHistoryProvider:
+    """Micro provider with no quote endpoint and no history rows."""
+
+    def get_history(self, symbol, start, end):
+        return _EMPTY_DF
+
+
+def test_market_data_service_get_price_soft_fails_to_none(mds, monkeypatch):
+    monkeypatch.setattr(
+        "services.core.market_data_service.micro_get_provider", _ForbiddenQuoteProvider
+    )
+    assert mds.get_price("FAIL3") is None
+    assert mds._circuit["FAIL3"].failures == 1
 
-    # Test _rate_limit (should not sleep long)
+
+def test_market_data_service_get_price_empty_history_returns_none(mds, monkeypatch):
+    monkeypatch.setattr(
+        "services.core.market_data_service.micro_get_provider", _EmptyHistoryProvider
+    )
+    assert mds.get_price("FAIL4") is None
+    assert "FAIL4" not in mds._circuit
+
+
+def test_market_data_service_get_price_cache_hit(mds):
+    provider = CountingPriceProvider(price=100)
+    mds._price_provider = provider
+    assert mds.get_price("AAPL") == 100
+    assert mds.get_price("AAPL") == 100
+    assert provider.call_count == 1
+
+
+def test_market_data_service_get_price_raises_after_retries(mds):
+    provider = FailingProvider()
+    mds._price_provider = provider
+    with pytest.raises(MarketDataDownloadError):
+        mds.get_price("FAIL")
+    assert provider.called
+
+
+@pytest.fixture(scope="module")
+def preseeded_cache(tmp_path_factory):
+    cache_dir = tmp_path_factory.mktemp("mds")
+    cache_path = cache_dir / "2099-01-01.json"
+    cache_path.write_text('{"AAPL":123.45}', encoding="utf-8")
+    return cache_dir, cache_path
+
+
+def test_market_data_service_daily_cache_rollover(mds, preseeded_cache, fake_clock, monkeypatch):
+    # Point the disk cache at a pre-written day file
+    cache_dir, cache_path = preseeded_cache
+    provider = ConstPriceProvider(price=42)
+    mds._price_provider = provider
+    monkeypatch.setattr(mds, "_now", fake_clock.time)
+    monkeypatch.setattr(mds, "_sleep", fake_clock.sleep)
+    # Scoped to this test: later users of the shared service keep their own cache dir
+    monkeypatch.setattr(mds, "_cache_format", "json")  # the seeded day file is JSON
+    monkeypatch.setattr(mds, "_disk_cache_dir", cache_dir)
+    monkeypatch.setattr(mds, "_disk_cache_day", "2099-01-01")
+    monkeypatch.setattr(mds, "_disk_cache_path", cache_path)
+    # Test _load_disk_cache against the seeded file
+    mds._daily_disk_cache = mds._load_disk_cache(cache_path)
+    assert mds._daily_disk_cache["AAPL"] == 123.45
+
+    # Test _rate_limit: with no minimum interval it short-circuits without waiting
+    mds._min_interval = 0.0
+    mds._last_call_ts = 0.0
+    mds._rate_limit()
+    assert fake_clock.time() == 1_000.0
+    assert mds._last_call_ts == 1_000.0
+
+    # A pending interval is waited out on the fake clock, not in wall time
     mds._min_interval = 0.01
-    mds._last_call_ts = time.time()
-    mds._rate_limit()  # Should not raise
+    mds._rate_limit()
+    assert mds._last_call_ts == pytest.approx(1_000.01)
 
     # Test circuit breaker logic
     ticker = "FAIL"
@@ -121,35 +190,31 @@ def test_market_data_service_daily_cache_rollover(tmp_path):
         mds._record_failure(ticker)
     # Should be open now
     assert mds._circuit_open(ticker)
-    # After cooldown, should reset
-    mds._circuit[ticker].opened_at = time.time() - mds._cooldown - 1
+    # After cooldown, should reset (half-open)
+    fake_clock.advance(mds._cooldown + 1)
     assert not mds._circuit_open(ticker)
     # Record success resets breaker
     mds._record_success(ticker, 99.9)
     assert mds._circuit[ticker].failures == 0
 
 
-def test_market_data_service_disk_cache_debounced(monkeypatch, tmp_path):
-    provider = DummyPriceProvider(price=50)
-    mds = MarketDataService(price_provider=provider, disk_flush_interval=10.0, disk_flush_batch=3)
-
-    mds._disk_cache_dir = tmp_path
-    mds._disk_cache_day = "2099-01-01"
-    mds._disk_cache_path = tmp_path / "2099-01-01.json"
-    mds._daily_disk_cache = {}
+def test_market_data_service_disk_cache_debounced(monkeypatch, mds_factory, fake_clock):
+    provider = ConstPriceProvider(price=50)
+    mds = mds_factory(price_provider=provider, disk_flush_interval=10.0, disk_flush_batch=3)
 
     save_calls: list[float] = []
-    original_save = MarketDataService._save_disk_cache
 
     def tracked_save(self: MarketDataService) -> None:
+        # Record the flush and mirror post-save state without touching disk
         save_calls.append(self._now())
-        original_save(self)
+        self._disk_cache_dirty = False
+        self._pending_disk_writes = 0
+        self._last_disk_flush = self._now()
 
     monkeypatch.setattr(MarketDataService, "_save_disk_cache", tracked_save)
 
-    current_time = 1_000.0
-    mds._now = lambda: current_time  # type: ignore[assignment]
-    mds._last_disk_flush = current_time
+    mds._now = fake_clock.time  # type: ignore[assignment]
+    mds._last_disk_flush = fake_clock.time()
 
     mds._record_success("AAA", 1.0)
     assert save_calls == []
@@ -163,10 +228,131 @@ def test_market_data_service_disk_cache_debounced(monkeypatch, tmp_path):
     assert not mds._disk_cache_dirty
     assert mds._pending_disk_writes == 0
 
-    current_time += 1
+    fake_clock.advance(1)
     mds._record_success("DDD", 4.0)
     assert len(save_calls) == 1
 
-    current_time += 11
+    fake_clock.advance(11)
     mds._flush_disk_cache_if_needed()
     assert len(save_calls) == 2
+
+
+@pytest.mark.parametrize("cache_format", ["json", "pickle"])
+def test_market_data_service_disk_cache_round_trip(mds, cache_format):
+    mds._cache_format = cache_format
+    mds._disk_cache_path = mds._disk_cache_file("2099-01-01")
+    mds._daily_disk_cache = {"AAPL": 123.45, "MSFT": 300.0}
+    mds._disk_cache_dirty = True
+
+    mds._save_disk_cache()
+
+    assert not mds._disk_cache_dirty
+    assert not mds._disk_cache_path.with_suffix(".tmp").exists()
+    assert mds._load_disk_cache(mds._disk_cache_path) == {"AAPL": 123.45, "MSFT": 300.0}
+
+
+def test_market_data_service_rejects_unknown_cache_format():
+    with pytest.raises(ValueError):
+        MarketDataService(cache_format="csv")  # type: ignore[arg-type]
+
+
+def test_market_data_service_serves_stale_while_revalidating(mds_factory):
+    prices = iter([10.0, 11.0])
+    svc = mds_factory(
+        price_provider=lambda t: next(prices), ttl_seconds=0, stale_while_revalidate=True
+    )
+
+    assert svc.get_price("AAPL") == 10.0
+    # Expired entry is served immediately; the refresh lands in the background
+    assert svc.get_price("AAPL") == 10.0
+    svc.close()
+    assert svc._cache["AAPL"][0] == 11.0
+    assert not svc._refreshing
+    assert svc._refresh_executor is None
+
+
+class _QuoteProvider:
+    """Micro provider whose quote is read at call time."""
+
+    def __init__(self, price):
+        self.price = price
+        self.calls = 0
+
+    def get_quote(self, symbol):
+        self.calls += 1
+        return {"price": self.price}
+
+
+def test_market_data_service_refresh_bypasses_disk_cache(mds_factory, monkeypatch):
+    provider = _QuoteProvider(price=11.0)
+    monkeypatch.setattr(
+        "services.core.market_data_service.micro_get_provider", lambda: provider
+    )
+    svc = mds_factory(ttl_seconds=0, stale_while_revalidate=True)
+    today = datetime.datetime.now(datetime.UTC).strftime("%Y-%m-%d")
+    svc._disk_cache_day = today
+    svc._disk_cache_path = svc._disk_cache_file(today)
+    svc._daily_disk_cache = {"AAPL": 10.0}
+
+    # The foreground read is served from the same-day disk cache
+    assert svc.get_price("AAPL") == 10.0
+    assert provider.calls == 0
+    # The stale entry is served while the refresh goes to the provider, not the disk
+    assert svc.get_price("AAPL") == 10.0
+    svc.close()
+    assert provider.calls == 1
+    assert svc._cache["AAPL"][0] == 11.0
+    assert svc._daily_disk_cache["AAPL"] == 11.0
+
+
+def test_market_data_service_rate_limit_reserves_slots(mds, fake_clock, monkeypatch):
+    # Concurrent callers each reserve the next slot, so waits stack instead of overlapping
+    waits = []
+    monkeypatch.setattr(mds, "_now", fake_clock.time)
+    monkeypatch.setattr(mds, "_sleep", waits.append)
+    mds._min_interval = 1.0
+    mds._last_call_ts = fake_clock.time()
+    for _ in range(3):
+        mds._rate_limit()
+    assert waits == pytest.approx([1.0, 2.0, 3.0])
+
+
+def test_market_data_service_blocks_once_past_the_stale_window(mds_factory, fake_clock, monkeypatch):
+    prices = iter([10.0, 11.0])
+    svc = mds_factory(
+        price_provider=lambda t: next(prices),
+        ttl_seconds=10,
+        stale_while_revalidate=True,
+        swr_seconds=5,
+    )
+    monkeypatch.setattr(svc, "_now", fake_clock.time)
+
+    assert svc.get_price("AAPL") == 10.0
+    fake_clock.advance(16)
+    # Too stale to serve: the read fetches in the foreground, no refresh is queued
+    assert svc.get_price("AAPL") == 11.0
+    assert svc._refresh_executor is None
+
+
+def test_market_data_service_circuit_cooldown_backs_off(mds, fake_clock, monkeypatch):
+    monkeypatch.setattr(mds, "_now", fake_clock.time)
+    ticker = "FLAKY"
+    for _ in range(mds._fail_threshold):
+        mds._record_failure(ticker)
+
+    cooldowns = []
+    for _ in range(10):
+        state = mds._circuit[ticker]
+        cooldowns.append(state.cooldown)
+        assert mds._circuit_open(ticker)
+        fake_clock.advance(state.cooldown + 0.01)
+        # Half-open: the probe is let through and a single failure re-trips
+        assert not mds._circuit_open(ticker)
+        mds._record_failure(ticker)
+
+    assert cooldowns == sorted(cooldowns)
+    assert cooldowns[0] <= mds._base_cooldown * 1.25
+    assert cooldowns[-1] == mds._cooldown
+
+    mds._record_success(ticker, 1.0)
+    assert mds._circuit[ticker].open_count == 0
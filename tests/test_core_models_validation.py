@@ -1,44 +1,48 @@
 import pytest
-from datetime import date, datetime
+from datetime import datetime
 from decimal import Decimal
 
 from services.core.models import Position, Trade, PortfolioSnapshot
 from services.core.validation import validate_price, validate_shares, validate_ticker
 from services.exceptions.validation import ValidationError
 
+# Fixed timestamps keep model construction deterministic and off the OS clock
+_FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+_FIXED_DATE = _FIXED_NOW.date()
 
-class TestValidationFunctions:
-    def test_validate_ticker_valid(self):
-        # Accepts standard, with dot, and alphanumeric
-        for t in ["AAPL", "BRK.B", "MSFT1"]:
-            validate_ticker(t)
 
-    def test_validate_ticker_invalid(self):
-        for t in ["", "123", "AAPL!", "TOOLONGSYMBL"]:
-            with pytest.raises(ValidationError):
-                validate_ticker(t)
+# Accepts standard, with dot, and alphanumeric
+@pytest.mark.parametrize("good", ["AAPL", "BRK.B", "MSFT1"])
+def test_validate_ticker_valid(good):
+    validate_ticker(good)
 
-    def test_validate_shares_valid(self):
-        validate_shares(1)
-        validate_shares(100)
 
-    def test_validate_shares_invalid(self):
-        for s in [0, -1]:
-            with pytest.raises(ValidationError):
-                validate_shares(s)
-        with pytest.raises(ValidationError):
-            validate_shares(1.5)  # type: ignore[arg-type]
+@pytest.mark.parametrize("bad", ["", "123", "AAPL!", "TOOLONGSYMBL"])
+def test_validate_ticker_invalid(bad):
+    with pytest.raises(ValidationError):
+        validate_ticker(bad)
 
-    def test_validate_price_valid(self):
-        validate_price(Decimal("1.00"))
-        validate_price(Decimal("0.01"))
 
-    def test_validate_price_invalid(self):
-        for p in [Decimal("0"), Decimal("-1")]:
-            with pytest.raises(ValidationError):
-                validate_price(p)
-        with pytest.raises(ValidationError):
-            validate_price(1.0)  # type: ignore[arg-type]
+@pytest.mark.parametrize("good", [1, 100])
+def test_validate_shares_valid(good):
+    validate_shares(good)
+
+
+@pytest.mark.parametrize("bad", [0, -1, 1.5])
+def test_validate_shares_invalid(bad):
+    with pytest.raises(ValidationError):
+        validate_shares(bad)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("good", [Decimal("1.00"), Decimal("0.01")])
+def test_validate_price_valid(good):
+    validate_price(good)
+
+
+@pytest.mark.parametrize("bad", [Decimal("0"), Decimal("-1"), 1.0])
+def test_validate_price_invalid(bad):
+    with pytest.raises(ValidationError):
+        validate_price(bad)  # type: ignore[arg-type]
 
 
 class TestModels:
@@ -49,7 +53,7 @@ class TestModels:
             buy_price=Decimal("150.00"),
             stop_loss=Decimal("0"),  # allowed
             cost_basis=Decimal("150.00"),
-            timestamp=datetime.now(),
+            timestamp=_FIXED_NOW,
         )
         assert pos.ticker == "AAPL"
         assert pos.shares == 10
@@ -87,7 +91,7 @@ class TestModels:
             side="BUY",
             shares=5,
             price=Decimal("320.10"),
-            timestamp=datetime.now(),
+            timestamp=_FIXED_NOW,
         )
         assert tr.ticker == "MSFT"
         assert tr.side == "BUY"
@@ -99,7 +103,7 @@ class TestModels:
                 side="SELL",
                 shares=5,
                 price=Decimal("320.10"),
-                timestamp=datetime.now(),
+                timestamp=_FIXED_NOW,
             )
         with pytest.raises(ValidationError):
             Trade(
@@ -107,7 +111,7 @@ class TestModels:
                 side="SELL",
                 shares=0,  # invalid
                 price=Decimal("320.10"),
-                timestamp=datetime.now(),
+                timestamp=_FIXED_NOW,
             )
         with pytest.raises(ValidationError):
             Trade(
@@ -115,12 +119,12 @@ class TestModels:
                 side="SELL",
                 shares=5,
                 price=Decimal("0"),  # invalid
-                timestamp=datetime.now(),
+                timestamp=_FIXED_NOW,
             )
 
     def test_snapshot_valid(self):
         snap = PortfolioSnapshot(
-            date=date.today(),
+            date=_FIXED_DATE,
             ticker="AAPL",
             shares=10,
             cost_basis=Decimal("150.00"),
@@ -138,7 +142,7 @@ class TestModels:
     def test_snapshot_invalid(self):
         with pytest.raises(ValidationError):
             PortfolioSnapshot(
-                date=date.today(),
+                date=_FIXED_DATE,
                 ticker="AAPL",
                 shares=10,
                 cost_basis=Decimal("0"),  # invalid
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -9,10 +10,28 @@ from services.core.portfolio_service import (
     compute_snapshot,
 )
 
+# Explicit dtypes so apply_buy/apply_sell never have to infer or up-cast object columns
+COLS = {
+    "ticker": "string",
+    "shares": "float64",
+    "buy_price": "float64",
+    "cost_basis": "float64",
+    "stop_loss": "float64",
+}
 
-def test_apply_buy_new_and_update():
-    df = pd.DataFrame(columns=["ticker", "shares", "buy_price", "cost_basis", "stop_loss"])
-    out = apply_buy(df, "AAPL", shares=10, price=100.0, stop_loss=90.0)
+# Snapshot inputs and expected total value, computed once at import
+_PRICES = {"AAPL": 110.0, "MSFT": 150.0}
+_SHARES = {"AAPL": 10.0, "MSFT": 5.0}
+_EXPECTED_TV = sum(_PRICES[t] * _SHARES[t] for t in _PRICES)
+
+
+@pytest.fixture
+def empty_portfolio_df():
+    return pd.DataFrame({c: pd.Series(dtype=t) for c, t in COLS.items()})
+
+
+def test_apply_buy_new_and_update(empty_portfolio_df):
+    out = apply_buy(empty_portfolio_df, "AAPL", shares=10, price=100.0, stop_loss=90.0)
     assert len(out) == 1
     assert out.iloc[0]["ticker"] == "AAPL"
     assert out.iloc[0]["shares"] == 10
@@ -27,10 +46,11 @@ def test_apply_buy_new_and_update():
     assert round(out2.iloc[0]["cost_basis"], 2) == 2000.0
 
 
-def test_apply_sell_and_pnl():
-    df = pd.DataFrame(
-        [{"ticker": "AAPL", "shares": 10.0, "buy_price": 100.0, "cost_basis": 1000.0}]
-    )
+def test_apply_sell_and_pnl(empty_portfolio_df):
+    df = pd.DataFrame.from_records(
+        [("AAPL", 10.0, 100.0, 1000.0, 0.0)], columns=list(COLS)
+    ).astype(COLS)
+    assert (df.dtypes == empty_portfolio_df.dtypes).all()
     out, pnl = apply_sell(df, "AAPL", shares=4, price=150.0)
     assert pnl == pytest.approx(200.0)
     assert out.iloc[0]["shares"] == 6.0
@@ -43,13 +63,14 @@ def test_apply_sell_and_pnl():
 
 def test_compute_snapshot_and_helpers():
     df = pd.DataFrame(
-        [
-            {"ticker": "AAPL", "shares": 10.0, "buy_price": 100.0, "stop_loss": 90.0},
-            {"ticker": "MSFT", "shares": 5.0, "buy_price": 200.0, "stop_loss": 180.0},
-        ]
+        {
+            "ticker": pd.array(list(_SHARES), dtype="string"),
+            "shares": np.fromiter(_SHARES.values(), dtype=np.float64),
+            "buy_price": np.array([100.0, 200.0]),
+            "stop_loss": np.array([90.0, 180.0]),
+        }
     )
-    prices = {"AAPL": 110.0, "MSFT": 150.0}
-    snap = compute_snapshot(df, prices, cash=1000.0, date="2025-08-11")
+    snap = compute_snapshot(df, _PRICES, cash=1000.0, date="2025-08-11")
 
     assert set(snap.columns) == {
         "Date",
@@ -65,7 +86,7 @@ def test_compute_snapshot_and_helpers():
         "Total Equity",
     }
     total_row = snap[snap["Ticker"] == "TOTAL"].iloc[0]
-    assert total_row["Total Value"] == pytest.approx(10 * 110 + 5 * 150)
+    assert total_row["Total Value"] == pytest.approx(_EXPECTED_TV)
     assert total_row["Total Equity"] == pytest.approx(total_row["Total Value"] + 1000.0)
 
     assert calculate_position_value(3, 7.5) == 22.5
@@ -1,12 +1,23 @@
 import pytest
 import pandas as pd
 from services.core.sqlite_repository import SqlitePortfolioRepository
-from data.db import init_db
+from data.db import get_connection, init_db
 
+_TRADE_ROW = {
+    "date": "2025-08-11",
+    "ticker": "AAPL",
+    "shares_bought": 10,
+    "buy_price": 100,
+    "cost_basis": 1000,
+    "pnl": 0,
+    "reason": "test",
+    "shares_sold": 0,
+    "sell_price": 0,
+}
 
-def test_sqlite_repository_crud(tmp_path):
-    db_file = tmp_path / "test.db"
-    repo = SqlitePortfolioRepository(str(db_file))
+
+def test_sqlite_repository_crud(memory_db):
+    repo = SqlitePortfolioRepository(memory_db)
     init_db()
     # Save and load
     df = pd.DataFrame(
@@ -18,21 +29,29 @@ def test_sqlite_repository_crud(tmp_path):
             "cost_basis": [1000],
         }
     )
-    repo.save_snapshot(df, 5000)
+    # Snapshot and trade log land in one transaction
+    with repo.transaction():
+        repo.save_snapshot(df, 5000)
+        repo.append_trade_log(_TRADE_ROW)
     result = repo.load()
     assert not result.portfolio.empty
     assert result.cash == 5000
-    # Append trade log
-    repo.append_trade_log(
-        {
-            "date": "2025-08-11",
-            "ticker": "AAPL",
-            "shares_bought": 10,
-            "buy_price": 100,
-            "cost_basis": 1000,
-            "pnl": 0,
-            "reason": "test",
-            "shares_sold": 0,
-            "sell_price": 0,
-        }
-    )
+    row = _TRADE_ROW
+    # Batched append writes every row in one transaction
+    assert repo.append_trade_log_batch([row] * 50) == 50
+    assert repo.append_trade_log_batch([]) == 0
+    with get_connection() as conn:
+        count = conn.execute("SELECT COUNT(*) FROM trade_log").fetchone()[0]
+    assert count == 51
+
+
+def test_sqlite_repository_transaction_rolls_back(memory_db):
+    repo = SqlitePortfolioRepository(memory_db)
+    init_db()
+    with pytest.raises(RuntimeError):
+        with repo.transaction():
+            repo.append_trade_log(_TRADE_ROW)
+            raise RuntimeError("abort")
+    with get_connection() as conn:
+        count = conn.execute("SELECT COUNT(*) FROM trade_log").fetchone()[0]
+    assert count == 0
@@ -5,10 +5,13 @@ This focuses on testing the specific functions and edge cases
 that haven't been covered by the comprehensive tests.
 """
 import unittest
+from contextlib import ExitStack
 from unittest.mock import patch, MagicMock
 import pandas as pd
 import numpy as np
+import pytest
 from datetime import datetime
+from types import SimpleNamespace
 
 from config.summary_config import create_test_config, set_config, get_config
 from ui.summary import (
@@ -19,19 +22,39 @@ from ui.summary import (
     get_portfolio_history_for_analytics
 )
 
+# Shared immutable date index; tests slice the prefix they need
+_DATES = pd.date_range("2024-01-01", periods=60, freq="D")
+
+# Seeded generator so noisy series are deterministic across runs
+_RNG = np.random.default_rng(1234)
+# Noise drawn once at import so results don't depend on test order
+_EQ_NOISE_30 = _RNG.normal(0, 50, 30)
+_BM_NOISE_30 = _RNG.normal(0, 20, 30)
+
+# Constant extreme values; built once at import rather than per test
+EXTREME_CONFIG = create_test_config(
+    default_history_months=0,  # Zero months
+    min_observations_for_metrics=1000,  # Very high threshold
+    price_cache_ttl_minutes=0,  # No caching
+    currency_precision=10,  # High precision
+    percentage_precision=0   # No decimal places
+)
+
 
 class TestRemainingCoverage(unittest.TestCase):
     """Tests targeting remaining uncovered code paths."""
     
-    def setUp(self):
-        """Set up test configuration."""
-        self.original_config = get_config()
-        self.test_config = create_test_config()
-        set_config(self.test_config)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test configuration once; configs are frozen so tests can share it."""
+        cls._saved = get_config()
+        cls._base_cfg = create_test_config()
+        set_config(cls._base_cfg)
     
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Restore configuration."""
-        set_config(self.original_config)
+        set_config(cls._saved)
     
     def test_build_daily_summary_empty_data(self):
         """Test build_daily_summary with empty data."""
@@ -56,7 +79,7 @@ class TestRemainingCoverage(unittest.TestCase):
     def test_build_daily_summary_valid_data(self):
         """Test build_daily_summary with valid data."""
         df = pd.DataFrame({
-            "date": pd.date_range("2024-01-01", periods=5),
+            "date": _DATES[:5],
             "ticker": ["AAPL"] * 5,
             "total_equity": [10000, 10100, 10200, 10150, 10300],
             "shares": [100] * 5,
@@ -73,14 +96,14 @@ class TestRemainingCoverage(unittest.TestCase):
         """Test complete risk metrics computation."""
         # Create portfolio data with sufficient observations
         portfolio_history = pd.DataFrame({
-            "date": pd.date_range("2024-01-01", periods=30),
-            "total_equity": [10000 + i * 100 + np.random.normal(0, 50) for i in range(30)]
+            "date": _DATES[:30],
+            "total_equity": 10000 + np.arange(30) * 100 + _EQ_NOISE_30
         })
         
         # Create benchmark data
         benchmark_history = pd.DataFrame({
-            "date": pd.date_range("2024-01-01", periods=30),
-            "close": [4000 + i * 10 + np.random.normal(0, 20) for i in range(30)]
+            "date": _DATES[:30],
+            "close": 4000 + np.arange(30) * 10 + _BM_NOISE_30
         })
         
         mock_history.return_value = benchmark_history
@@ -103,7 +126,7 @@ class TestRemainingCoverage(unittest.TestCase):
         """Test risk metrics with insufficient data."""
         # Portfolio with too few observations
         portfolio_history = pd.DataFrame({
-            "date": pd.date_range("2024-01-01", periods=3),
+            "date": _DATES[:3],
             "total_equity": [10000, 10100, 10200]
         })
         
@@ -121,8 +144,8 @@ class TestRemainingCoverage(unittest.TestCase):
     def test_compute_risk_metrics_no_benchmark(self, mock_history):
         """Test risk metrics when benchmark fetch fails."""
         portfolio_history = pd.DataFrame({
-            "date": pd.date_range("2024-01-01", periods=20),
-            "total_equity": [10000 + i * 100 for i in range(20)]
+            "date": _DATES[:20],
+            "total_equity": np.arange(20, dtype=np.float64) * 100 + 10000.0
         })
         
         mock_history.side_effect = Exception("Benchmark fetch failed")
@@ -143,13 +166,13 @@ class TestRemainingCoverage(unittest.TestCase):
         def mock_price_history(symbol, **kwargs):
             if symbol == "AAPL":
                 return pd.DataFrame({
-                    "date": pd.date_range("2024-01-01", periods=10),
-                    "close": [150 + i for i in range(10)]
+                    "date": _DATES[:10],
+                    "close": np.arange(10, dtype=np.float64) + 150.0
                 })
             elif symbol == "MSFT":
                 return pd.DataFrame({
-                    "date": pd.date_range("2024-01-01", periods=10),
-                    "close": [300 + i * 2 for i in range(10)]
+                    "date": _DATES[:10],
+                    "close": np.arange(10, dtype=np.float64) * 2 + 300.0
                 })
             else:
                 return pd.DataFrame()
@@ -171,7 +194,7 @@ class TestRemainingCoverage(unittest.TestCase):
     def test_build_portfolio_history_invalid_shares(self, mock_history):
         """Test portfolio history with invalid share amounts."""
         mock_history.return_value = pd.DataFrame({
-            "date": pd.date_range("2024-01-01", periods=5),
+            "date": _DATES[:5],
             "close": [100, 101, 102, 103, 104]
         })
         
@@ -199,8 +222,8 @@ class TestRemainingCoverage(unittest.TestCase):
         
         with patch('ui.summary._build_portfolio_history_from_market') as mock_build:
             mock_build.return_value = pd.DataFrame({
-                "date": pd.date_range("2024-01-01", periods=10),
-                "total_equity": [10000 + i * 100 for i in range(10)]
+                "date": _DATES[:10],
+                "total_equity": np.arange(10, dtype=np.float64) * 100 + 10000.0
             })
             
             result_df, is_synthetic = get_portfolio_history_for_analytics(
@@ -215,9 +238,9 @@ class TestRemainingCoverage(unittest.TestCase):
         """Test portfolio history with invalid equity data."""
         # Create history without proper total_equity
         invalid_history = pd.DataFrame({
-            "date": pd.date_range("2024-01-01", periods=10),
+            "date": _DATES[:10],
             "ticker": ["AAPL"] * 10,  # No TOTAL ticker
-            "price": [100 + i for i in range(10)]
+            "price": np.arange(10, dtype=np.float64) + 100.0
         })
         
         holdings_df = pd.DataFrame([{"symbol": "AAPL", "shares": 100}])
@@ -231,89 +254,79 @@ class TestRemainingCoverage(unittest.TestCase):
             
             # Should attempt synthetic generation
             mock_build.assert_called_once()
-    
-    @patch('ui.summary.get_cached_price_data')
-    @patch('ui.summary.get_cached_price_history')
-    @patch('ui.summary.warm_cache_for_symbols')
-    def test_render_daily_summary_error_paths(self, mock_warm, mock_history, mock_price):
-        """Test error handling paths in render_daily_portfolio_summary."""
-        # Test various error scenarios
-        error_scenarios = [
-            # Price data errors
-            (lambda: setattr(mock_price, 'side_effect', Exception("Price error")), "price"),
-            # History data errors
-            (lambda: setattr(mock_history, 'side_effect', Exception("History error")), "history"),
-            # Cache warming errors
-            (lambda: setattr(mock_warm, 'side_effect', Exception("Cache error")), "cache")
-        ]
-        
-        sample_data = {
-            "asOfDate": "2024-01-15",
-            "cashBalance": 1000.0,
-            "holdings": [{"symbol": "AAPL", "shares": 10}]
-        }
-        
-        for error_setup, error_type in error_scenarios:
-            # Reset mocks
-            mock_price.reset_mock()
-            mock_history.reset_mock()
-            mock_warm.reset_mock()
-            
-            # Set up error
-            error_setup()
-            
-            # Should still return a result
-            result = render_daily_portfolio_summary(sample_data)
-            self.assertIsInstance(result, str)
-    
-    def test_edge_case_data_types(self):
-        """Test handling of edge case data types."""
-        edge_case_data = {
-            "asOfDate": 20240115,  # Integer instead of string
-            "cashBalance": "1000.0",  # String instead of float
-            "holdings": None,  # None instead of list
-            "summaryFrame": "invalid",  # String instead of DataFrame
-            "history": [],  # Empty list instead of DataFrame
-            "indexSymbols": "^GSPC",  # String instead of list
-        }
-        
-        with patch('ui.summary.get_cached_price_data'), \
-             patch('ui.summary.get_cached_price_history'), \
-             patch('ui.summary.warm_cache_for_symbols'):
-            
-            # Should handle gracefully without crashing
-            result = render_daily_portfolio_summary(edge_case_data)
-            self.assertIsInstance(result, str)
-    
-    def test_configuration_edge_cases(self):
-        """Test configuration edge cases."""
-        # Test with extreme configuration values
-        extreme_config = create_test_config(
-            default_history_months=0,  # Zero months
-            min_observations_for_metrics=1000,  # Very high threshold
-            price_cache_ttl_minutes=0,  # No caching
-            currency_precision=10,  # High precision
-            percentage_precision=0   # No decimal places
-        )
-        
-        sample_data = {
-            "asOfDate": "2024-01-15",
-            "cashBalance": 1234.5678,
-            "holdings": [{"symbol": "AAPL", "shares": 10, "price": 150.123456}]
-        }
-        
-        with patch('ui.summary.get_cached_price_data') as mock_price, \
-             patch('ui.summary.get_cached_price_history'), \
-             patch('ui.summary.warm_cache_for_symbols'):
-            
-            mock_price.return_value = {"symbol": "AAPL", "close": 150.123456, "pct_change": 1.23456, "volume": 1000000}
-            
-            result = render_daily_portfolio_summary(sample_data, config=extreme_config)
-            
-            # Should handle extreme config values
-            self.assertIsInstance(result, str)
-            # Check precision is applied
-            self.assertIn("1,234.5678000000", result)  # High currency precision
+
+
+_ERROR_PATHS_SAMPLE_DATA = {
+    "asOfDate": "2024-01-15",
+    "cashBalance": 1000.0,
+    "holdings": [{"symbol": "AAPL", "shares": 10}]
+}
+
+
+_ERROR_PATH_TARGETS = {
+    "price": "ui.summary.get_cached_price_data",
+    "history": "ui.summary.get_cached_price_history",
+    "cache": "ui.summary.warm_cache_for_symbols",
+}
+
+
+@pytest.mark.parametrize("victim", list(_ERROR_PATH_TARGETS))
+def test_render_daily_summary_error_paths(victim):
+    """Test error handling paths in render_daily_portfolio_summary."""
+    # Fresh patches per scenario; only the victim raises
+    with ExitStack() as stack:
+        for name, target in _ERROR_PATH_TARGETS.items():
+            kwargs = {"side_effect": Exception(f"{name.capitalize()} error")} if name == victim else {}
+            stack.enter_context(patch(target, **kwargs))
+
+        # Should still return a result
+        result = render_daily_portfolio_summary(_ERROR_PATHS_SAMPLE_DATA)
+
+    assert isinstance(result, str)
+
+
+@pytest.fixture
+def patched_summary(monkeypatch):
+    """Stub the summary module's market-data dependencies; unwound automatically."""
+    mocks = SimpleNamespace(price=MagicMock(), history=MagicMock(), warm=MagicMock())
+    monkeypatch.setattr("ui.summary.get_cached_price_data", mocks.price)
+    monkeypatch.setattr("ui.summary.get_cached_price_history", mocks.history)
+    monkeypatch.setattr("ui.summary.warm_cache_for_symbols", mocks.warm)
+    return mocks
+
+
+def test_edge_case_data_types(patched_summary):
+    """Test handling of edge case data types."""
+    edge_case_data = {
+        "asOfDate": 20240115,  # Integer instead of string
+        "cashBalance": "1000.0",  # String instead of float
+        "holdings": None,  # None instead of list
+        "summaryFrame": "invalid",  # String instead of DataFrame
+        "history": [],  # Empty list instead of DataFrame
+        "indexSymbols": "^GSPC",  # String instead of list
+    }
+
+    # Should handle gracefully without crashing
+    result = render_daily_portfolio_summary(edge_case_data)
+    assert isinstance(result, str)
+
+
+def test_configuration_edge_cases(patched_summary):
+    """Test configuration edge cases."""
+    sample_data = {
+        "asOfDate": "2024-01-15",
+        "cashBalance": 1234.5678,
+        "holdings": [{"symbol": "AAPL", "shares": 10, "price": 150.123456}]
+    }
+    patched_summary.price.return_value = {"symbol": "AAPL", "close": 150.123456, "pct_change": 1.23456, "volume": 1000000}
+
+    # Test with extreme configuration values
+    result = render_daily_portfolio_summary(sample_data, config=EXTREME_CONFIG)
+
+    # Should handle extreme config values
+    assert isinstance(result, str)
+    # Check precision is applied
+    assert "1,234.5678000000" in result  # High currency precision
 
 
 if __name__ == '__main__':
@@ -1,6 +1,4 @@
 import sqlite3
-import tempfile
-from pathlib import Path
 from datetime import datetime
 
 import pandas as pd
@@ -20,9 +18,12 @@ except Exception:
     from app_settings import settings
 
 
-def _create_temp_db_with_history(rows):
-    fd, path = tempfile.mkstemp(suffix=".db")
-    conn = sqlite3.connect(path)
+def _create_temp_db_with_history(uri, rows):
+    """Populate portfolio_history in the in-memory DB at ``uri``."""
+    conn = sqlite3.connect(uri, uri=True)
+    # Test data needs no durability; build it in a single transaction
+    conn.executescript("PRAGMA synchronous=OFF; PRAGMA journal_mode=MEMORY; PRAGMA temp_store=MEMORY;")
+    conn.execute("BEGIN")
     cur = conn.cursor()
     cur.execute(
         """
@@ -44,10 +45,9 @@ def _create_temp_db_with_history(rows):
     cur.executemany("INSERT INTO portfolio_history VALUES (?,?,?,?,?,?,?,?,?,?,?)", rows)
     conn.commit()
     conn.close()
-    return path
 
 
-def test_generate_daily_summary_merges_history_and_sets_session(monkeypatch, tmp_path):
+def test_generate_daily_summary_merges_history_and_sets_session(monkeypatch, memory_db):
     """Integration-style test: history snapshot -> portfolio snapshot -> rendered markdown."""
     # Prepare a small history: TOTAL row + one ticker row with shares and cost_basis
     today = datetime.now().strftime("%Y-%m-%d")
@@ -56,21 +56,22 @@ def test_generate_daily_summary_merges_history_and_sets_session(monkeypatch, tmp
         (today, "ABC", 100.0, 10.0, None, 12.0, 1200.0, 200.0, None, None, None),
     ]
 
-    db_path = _create_temp_db_with_history(rows)
+    # memory_db keeps the shared-cache database alive for the whole test
+    db_path = memory_db
+    _create_temp_db_with_history(db_path, rows)
 
     # Point settings to the temp DB for the duration of the test
-    monkeypatch.setattr(settings.paths, "db_file", db_path)
+    # settings.paths is rebuilt on each access, so patch the underlying field
+    monkeypatch.setattr(settings, "db_file", db_path)
 
     # Directly exercise the helper pipeline used by the dashboard when generating summary
     # Avoid importing pages.performance_page (which pulls heavy project imports).
     # Instead, read the portfolio_history table directly from the temp DB to form a DataFrame.
-    import sqlite3 as _sqlite
-
-    conn = _sqlite.connect(str(settings.paths.db_file))
-    import pandas as _pd
-
-    history = _pd.read_sql_query("SELECT * FROM portfolio_history", conn, parse_dates=["date"])
+    conn = sqlite3.connect(str(settings.paths.db_file), uri=True)
+    cur = conn.execute("SELECT * FROM portfolio_history")
+    history = pd.DataFrame(cur.fetchall(), columns=[d[0] for d in cur.description])
     conn.close()
+    history["date"] = pd.to_datetime(history["date"])
     from ui.summary import history_to_portfolio_snapshot, render_daily_portfolio_summary
 
     # Emulate the snapshot loader logic (past 6 months) via the helper
@@ -1,26 +1,23 @@
-import tempfile
-from pathlib import Path
-import pandas as pd
-
 from config.providers import is_dev_stage
 from data import portfolio as portfolio_mod
 
 
-def test_dev_stage_seeding_with_history(monkeypatch):
+def _seeded_tickers(result) -> set[str]:
+    # PortfolioResult is already a DataFrame; read the column without re-wrapping it
+    if "ticker" not in result.columns:
+        return set()
+    return {str(t).upper() for t in result["ticker"]}
+
+
+def test_dev_stage_seeding_with_history(monkeypatch, memory_db):
     """Ensure dev_stage seeding includes historical data for portfolio tracking."""
     monkeypatch.setenv("APP_ENV", "dev_stage")
     assert is_dev_stage()
 
-    tmpdir = tempfile.TemporaryDirectory()
-    db_path = Path(tmpdir.name) / "history_test.db"
-    monkeypatch.setattr("data.db.DB_FILE", db_path)
-
     # Load portfolio (triggers seeding)
     result = portfolio_mod.load_portfolio()
-    df = pd.DataFrame(result)
-    
     # Verify base seeding
-    tickers = set(df["ticker"].str.upper()) if "ticker" in df else set()
+    tickers = _seeded_tickers(result)
     assert {"SYNAAA", "SYNBBB"}.issubset(tickers)
     assert result.cash >= 10_000.0
 
@@ -33,22 +30,15 @@ def test_dev_stage_seeding_with_history(monkeypatch):
     # Should have historical data spanning multiple days
     assert history_count > 10  # At least positions + TOTAL rows for multiple days
     assert unique_dates >= 15  # At least 15 days of history
-    
-    tmpdir.cleanup()
 
 
-def test_dev_stage_seeding(monkeypatch):
+def test_dev_stage_seeding(monkeypatch, memory_db):
     """Ensure an empty DB in dev_stage seeds synthetic positions and cash."""
     monkeypatch.setenv("APP_ENV", "dev_stage")
     assert is_dev_stage()
 
-    tmpdir = tempfile.TemporaryDirectory()
-    db_path = Path(tmpdir.name) / "seed_test.db"
-    monkeypatch.setattr("data.db.DB_FILE", db_path)
-
     result = portfolio_mod.load_portfolio()
-    df = pd.DataFrame(result)
-    tickers = set(df["ticker"].str.upper()) if "ticker" in df else set()
+    tickers = _seeded_tickers(result)
     assert {"SYNAAA", "SYNBBB"}.issubset(tickers)
     assert result.cash >= 10_000.0
 
@@ -56,5 +46,3 @@ def test_dev_stage_seeding(monkeypatch):
     with get_connection() as conn:
         rows = conn.execute("SELECT COUNT(*) FROM portfolio_history").fetchone()[0]
     assert rows > 0
-    
-    tmpdir.cleanup()
@@ -7,31 +7,38 @@ from micro_data_providers import FinnhubDataProvider
 
 
 class FakeClient:
+    # Static responses are built once and returned by reference; the provider only reads them
+    __slots__ = ("calls", "_quote", "_candle_values", "_profile", "_financials", "_news")
+
     def __init__(self):
         self.calls = {"quote": 0, "stock_candles": 0, "company_profile2": 0, "company_basic_financials": 0, "company_news": 0, "earnings_calendar": 0}
+        self._quote = {"c": 10.0, "pc": 9.5}
+        self._candle_values = {"o": [10, 11], "h": [11, 12], "l": [9, 10], "c": [10.5, 11.5], "v": [1000, 2000]}
+        self._profile = {"exchange": "NASDAQ", "finnhubIndustry": "Technology"}
+        self._financials = {"metric": {"marketCapitalization": 123_456_789}}
+        self._news = [{"headline": "Test headline"}]
 
     def quote(self, symbol):
         self.calls["quote"] += 1
-        return {"c": 10.0, "pc": 9.5}
+        return self._quote
 
     def stock_candles(self, symbol, resol, _from, to):
         self.calls["stock_candles"] += 1
-        # two days
+        # two days; only the timestamps depend on the request window
         t0 = _from + 86400
-        t1 = t0 + 86400
-        return {"s": "ok", "t": [t0, t1], "o": [10, 11], "h": [11, 12], "l": [9, 10], "c": [10.5, 11.5], "v": [1000, 2000]}
+        return {"s": "ok", "t": [t0, t0 + 86400], **self._candle_values}
 
     def company_profile2(self, symbol):
         self.calls["company_profile2"] += 1
-        return {"exchange": "NASDAQ", "finnhubIndustry": "Technology"}
+        return self._profile
 
     def company_basic_financials(self, ticker, metric):
         self.calls["company_basic_financials"] += 1
-        return {"metric": {"marketCapitalization": 123_456_789}}
+        return self._financials
 
     def company_news(self, symbol, _from, to):
         self.calls["company_news"] += 1
-        return [{"headline": "Test headline"}]
+        return self._news
 
     def earnings_calendar(self, _from, to, symbol=None):
         self.calls["earnings_calendar"] += 1
@@ -54,6 +61,7 @@ def test_finnhub_mapping_and_cache(tmp_path, monkeypatch):
     df = provider.get_daily_candles("AAA", start, end)
     assert list(df.columns) == ["date", "open", "high", "low", "close", "volume"]
     assert len(df) == 2 and isinstance(df.loc[0, "date"], pd.Timestamp)
+    assert (df[["open", "high", "low", "close"]].dtypes == "float64").all()
     # Profile
     prof = provider.get_company_profile("AAA")
     assert prof["exchange"] == "NASDAQ" and prof["sector"] == "Technology" and prof["marketCap"] == 123_456_789
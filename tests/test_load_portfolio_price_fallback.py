@@ -1,31 +1,32 @@
 import pandas as pd
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
+from data.db import get_connection, init_db
 from data.portfolio import load_portfolio
 
-@patch("data.portfolio.get_connection")
-@patch("data.portfolio.init_db")
+_ROWS = [
+    ("AAPL", 10.0, 90.0, 100.0, 1000.0),
+    ("MSFT", 5.0, 180.0, 200.0, 1000.0),
+]
+
+
 @patch("data.portfolio.fetch_prices")
-@patch("services.market.get_current_price")
-def test_load_portfolio_individual_price_fallback(mock_get_current_price, mock_fetch_prices, mock_init_db, mock_get_conn):
-    # Mock DB portfolio rows
-    mock_conn = MagicMock()
-    mock_get_conn.return_value.__enter__.return_value = mock_conn
-    # Simulate read_sql_query fallback path raising then alternative cursor path returning rows
+def test_load_portfolio_individual_price_fallback(mock_fetch_prices, memory_db, monkeypatch):
+    # Real in-memory database instead of a MagicMock connection
+    init_db()
+    with get_connection() as conn:
+        conn.executemany(
+            "INSERT INTO portfolio (ticker, shares, stop_loss, buy_price, cost_basis) VALUES (?, ?, ?, ?, ?)",
+            _ROWS,
+        )
+        conn.execute("INSERT INTO cash (id, balance) VALUES (0, 500.0)")
+
+    # Simulate read_sql_query failing so the cursor fallback path runs
     with patch("pandas.read_sql_query", side_effect=Exception("boom")):
-        # Cursor returns two rows
-        mock_conn.execute.return_value.fetchall.return_value = [
-            ("AAPL", 10, 90.0, 100.0, 1000.0),
-            ("MSFT", 5, 180.0, 200.0, 1000.0),
-        ]
-        # Cash row
-        mock_conn.execute.return_value.fetchone.return_value = [500.0]
         # Bulk fetch returns empty -> triggers individual fallback
         mock_fetch_prices.return_value = pd.DataFrame(columns=["ticker", "current_price", "pct_change"])
-        # Individual prices: only one succeeds
-        def _price(t):
-            return 120.0 if t == "AAPL" else None
-        mock_get_current_price.side_effect = _price
+        # Individual prices: only one succeeds; a plain dict lookup avoids MagicMock dispatch
+        monkeypatch.setattr("services.market.get_current_price", {"AAPL": 120.0}.get)
 
         portfolio, cash, is_first_time = load_portfolio()
         assert cash == 500.0
@@ -29,3 +29,11 @@ def test_manual_pricing_clear_all():
     assert mp.manual_pricing_service.get_all_prices() == {'ZZZ': 1.23}
     mp.manual_pricing_service.clear_all()
     assert mp.manual_pricing_service.get_all_prices() == {}
+
+
+def test_manual_pricing_normalizes_keys():
+    mp.manual_pricing_service.clear_all()
+    mp.set_manual_price(' brk.b ', 400.0)
+    assert mp.manual_pricing_service.get_all_prices() == {'BRK.B': 400.0}
+    assert mp.get_manual_price('Brk.B') == 400.0
+    mp.manual_pricing_service.clear_all()
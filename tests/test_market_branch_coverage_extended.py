@@ -42,3 +42,19 @@ def test_fetch_prices_dev_stage(monkeypatch):
     msft_val = out[out["ticker"]=="MSFT"]["current_price"].iloc[0]
     assert (aapl_val is None) or isinstance(aapl_val, (int, float))
     assert (msft_val is None) or isinstance(msft_val, (int, float)) or pd.isna(msft_val)
+
+
+def test_synthetic_closes_use_batch_history_api(monkeypatch):
+    calls = []
+
+    class BatchProvider:
+        def get_histories(self, tickers, start, end):
+            calls.append(list(tickers))
+            return {"AAPL": pd.DataFrame({"close": [120.0, 121.5]})}
+
+    monkeypatch.setattr(market, "get_provider", lambda: BatchProvider())
+    closes = market._get_synthetic_closes(["AAPL", "MSFT"])
+    assert calls == [["AAPL", "MSFT"]]
+    assert closes.index.tolist() == ["AAPL", "MSFT"]
+    assert closes["AAPL"] == 121.5 and pd.isna(closes["MSFT"])
+    assert market._get_synthetic_close("AAPL") == 121.5
@@ -1,20 +1,39 @@
 import pandas as pd
+import pytest
 import services.market as market
-import time
+from requests.adapters import HTTPAdapter
 
 def test_internal_rate_limit(monkeypatch):
-    calls = {"sleep": 0}
-    def fake_sleep(x):
-        calls["sleep"] += 1
-    monkeypatch.setattr(market.time, "sleep", fake_sleep)
-    market._last_request_time = time.time() - 0.1
+    sleeps = []
+    now = 1000.0
+    monkeypatch.setattr(market.time, "sleep", sleeps.append)
+    monkeypatch.setattr(market.time, "monotonic", lambda: now)
+    monkeypatch.setattr(market, "_bucket_last", now)
+    monkeypatch.setattr(market, "_bucket_tokens", 0.0)
     market._rate_limit()
-    assert calls["sleep"] == 1
+    assert sleeps == [pytest.approx(1.0 / market._BUCKET_RATE)]
+
+
+def test_internal_rate_limit_allows_burst(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(market.time, "sleep", sleeps.append)
+    monkeypatch.setattr(market.time, "monotonic", lambda: 1000.0)
+    monkeypatch.setattr(market, "_bucket_last", 1000.0)
+    monkeypatch.setattr(market, "_bucket_tokens", float(market._BUCKET_CAP))
+    for _ in range(market._BUCKET_CAP):
+        market._rate_limit()
+    assert sleeps == []
+    market._rate_limit()
+    market._rate_limit()
+    assert sleeps == pytest.approx([1.0 / market._BUCKET_RATE, 2.0 / market._BUCKET_RATE])
 
 def test_internal_session_cache():
     s1 = market._get_session()
     s2 = market._get_session()
     assert s1 is s2
+    adapter = s1.get_adapter("https://finnhub.io")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_maxsize == market._HTTP_POOL_SIZE
 
 def test_internal_download_helper_removed():
     price, had_exc, had_nonempty = market._download_close_price("ABC", legacy=False)
@@ -16,7 +16,7 @@ def test_fetch_price_v2_fallback_to_legacy(monkeypatch):
 
     # Ensure flag disabled
     monkeypatch.delenv("ENABLE_MICRO_PROVIDERS", raising=False)
-    m._micro_provider_cache = None  # type: ignore
+    m._reset_micro_provider_cache()
     # track legacy call
     called = {}
 
@@ -36,7 +36,7 @@ def test_fetch_price_v2_micro_enabled(monkeypatch):
     import services.market as m
 
     monkeypatch.setenv("ENABLE_MICRO_PROVIDERS", "1")
-    m._micro_provider_cache = None  # type: ignore
+    m._reset_micro_provider_cache()
 
     class FakeProv:
         def get_quote(self, ticker):
@@ -54,31 +54,51 @@ def test_fetch_prices_v2_micro_enabled(monkeypatch):
     import services.market as m
 
     monkeypatch.setenv("ENABLE_MICRO_PROVIDERS", "1")
-    m._micro_provider_cache = None  # type: ignore
+    m._reset_micro_provider_cache()
 
     class FakeProv:
         def __init__(self):
             self.calls = []
         def get_quote(self, ticker):
+            # Quotes run concurrently, so derive the price from the ticker, not call order
             self.calls.append(ticker)
-            base = 10.0 + len(self.calls)
-            return {"price": base, "percent": 0.5}
+            return {"price": 10.0 + int(ticker[1:]), "percent": 0.5}
 
     fake = FakeProv()
     monkeypatch.setattr(m, '_get_micro_provider', lambda: fake)
     monkeypatch.setattr(m, 'fetch_prices', lambda tickers: pd.DataFrame())  # legacy bypass
 
-    df = m.fetch_prices_v2(['AAA','BBB'])
-    assert list(df['ticker']) == ['AAA','BBB']
-    assert df['current_price'].tolist() == [11.0, 12.0]
-    assert df['pct_change'].tolist() == [0.5, 0.5]
+    tickers = [f"T{i}" for i in range(50)]
+    df = m.fetch_prices_v2(tickers)
+    assert list(df['ticker']) == tickers
+    assert df['current_price'].tolist() == [10.0 + i for i in range(50)]
+    assert df['pct_change'].tolist() == [0.5] * 50
+    assert (df[["current_price", "pct_change"]].dtypes == "float64").all()
+    assert sorted(fake.calls) == sorted(tickers)
+
+
+def test_fetch_prices_v2_micro_enabled_empty_tickers(monkeypatch):
+    import services.market as m
+
+    monkeypatch.setenv("ENABLE_MICRO_PROVIDERS", "1")
+    m._reset_micro_provider_cache()
+
+    class FakeProv:
+        def get_quote(self, ticker):  # pragma: no cover - must not be called
+            raise AssertionError("no tickers to quote")
+
+    monkeypatch.setattr(m, '_get_micro_provider', lambda: FakeProv())
+
+    df = m.fetch_prices_v2([])
+    assert df.empty
+    assert list(df.columns) == ["ticker", "current_price", "pct_change"]
 
 
 def test_fetch_price_v2_micro_error_fallback(monkeypatch):
     import services.market as m
 
     monkeypatch.setenv("ENABLE_MICRO_PROVIDERS", "1")
-    m._micro_provider_cache = None  # type: ignore
+    m._reset_micro_provider_cache()
 
     class BadProv:
         def get_quote(self, ticker):
@@ -88,3 +108,59 @@ def test_fetch_price_v2_micro_error_fallback(monkeypatch):
     monkeypatch.setattr(m, 'fetch_price', lambda t: 55.5)
 
     assert m.fetch_price_v2('XYZ') == 55.5
+
+
+class _FlakyBuilder:
+    """get_micro_provider stand-in that fails until ``ready`` is set."""
+
+    def __init__(self):
+        self.ready = False
+        self.builds = 0
+        self.provider = object()
+
+    def __call__(self):
+        self.builds += 1
+        if not self.ready:
+            raise RuntimeError("FINNHUB_API_KEY is required in production mode")
+        return self.provider
+
+
+def test_micro_provider_failure_expires_after_retry_window(monkeypatch):
+    import services.market as m
+
+    monkeypatch.setenv("ENABLE_MICRO_PROVIDERS", "1")
+    now = [1000.0]
+    builder = _FlakyBuilder()
+    monkeypatch.setattr(m, "get_micro_provider", builder)
+    monkeypatch.setattr(m.time, "monotonic", lambda: now[0])
+    m._reset_micro_provider_cache()
+
+    assert m._get_micro_provider() is None
+    assert m._get_micro_provider() is None
+    assert builder.builds == 1  # failure remembered inside the window
+
+    builder.ready = True
+    now[0] += m._MICRO_PROVIDER_RETRY_SECONDS
+    assert m._get_micro_provider() is builder.provider
+    assert builder.builds == 2
+    m._reset_micro_provider_cache()
+
+
+def test_dashboard_toggle_re_resolves_micro_provider(monkeypatch, mock_streamlit):
+    import services.market as m
+    import ui.dashboard as dashboard
+
+    monkeypatch.setenv("ENABLE_MICRO_PROVIDERS", "1")
+    builder = _FlakyBuilder()
+    monkeypatch.setattr(m, "get_micro_provider", builder)
+    monkeypatch.setattr(dashboard, "st", mock_streamlit)
+    m._reset_micro_provider_cache()
+
+    assert m._get_micro_provider() is None
+    builder.ready = True
+    # Toggling the provider switch must drop the remembered failure immediately
+    dashboard._apply_micro_provider_toggle(True)
+    assert mock_streamlit.session_state.use_micro_providers is True
+    assert m._get_micro_provider() is builder.provider
+    assert builder.builds == 2
+    m._reset_micro_provider_cache()
@@ -6,7 +6,7 @@ from datetime import datetime, timedelta
 import pandas as pd
 import pytest
 
-from services.core.market_service import MarketService
+from services.core.market_service import MarketService, _date_range
 from services.portfolio_manager import PortfolioManager
 
 
@@ -68,6 +68,8 @@ class TestMarketServiceFetchHistory:
             
             assert result.empty
             assert list(result.columns) == ["date", "open", "high", "low", "close", "volume"]
+            assert pd.api.types.is_datetime64_any_dtype(result["date"])
+            assert (result[["open", "high", "low", "close", "volume"]].dtypes == "float64").all()
 
     def test_fetch_history_validates_inputs(self):
         """Test fetch_history handles invalid inputs gracefully."""
@@ -105,6 +107,19 @@ class TestMarketServiceFetchHistory:
             date_diff = end_date - start_date
             assert 170 <= date_diff.days <= 190  # Allow some variance
 
+    def test_fetch_history_reuses_date_range_within_a_day(self):
+        """Test back-to-back fetches share the cached date window."""
+        mock_provider = mock.MagicMock()
+        mock_provider.get_daily_candles.return_value = pd.DataFrame()
+
+        _date_range.cache_clear()
+        with mock.patch('micro_config.get_provider', return_value=mock_provider):
+            service = MarketService()
+            service.fetch_history("AAPL", months=6)
+            service.fetch_history("MSFT", months=6)
+
+        assert _date_range.cache_info().hits >= 1
+
 
 class TestPortfolioManagerFetchHistoryIntegration:
     """Test that PortfolioManager calls fetch_history when adding positions."""
@@ -128,6 +143,22 @@ class TestPortfolioManagerFetchHistoryIntegration:
         # Verify fetch_history was called
         mock_market_service.fetch_history.assert_called_once_with("AAPL", months=6)
 
+    def test_add_position_fetches_history_once_per_ticker(self):
+        """Test that re-adding a ticker reuses the history fetched this session."""
+        mock_market_service = mock.MagicMock()
+        mock_market_service.fetch_history.return_value = pd.DataFrame({
+            'date': [datetime.now().date()],
+            'close': [100.0],
+            'volume': [1000]
+        })
+
+        portfolio_manager = PortfolioManager(market_service=mock_market_service)
+        with mock.patch.object(portfolio_manager, "_save_history_for_ticker"):
+            portfolio_manager.add_position("AAPL", 10, 150.0)
+            portfolio_manager.add_position("AAPL", 5, 155.0)
+
+        assert mock_market_service.fetch_history.call_count == 1
+
     def test_add_position_validates_inputs(self):
         """Test that add_position validates inputs properly."""
         portfolio_manager = PortfolioManager()
@@ -222,3 +253,5 @@ class TestPortfolioManagerFetchHistoryIntegration:
         assert positions.iloc[0]["ticker"] == "AAPL"
         assert positions.iloc[0]["shares"] == 10
         assert positions.iloc[0]["price"] == 150.0
+        assert positions["shares"].dtype == "int64"
+        assert positions["cost_basis"].dtype == "float64"
@@ -23,6 +23,15 @@ def test_calculate_percentage_change_cases():
     assert pytest.approx(m.calculate_percentage_change(100, 110), rel=1e-6) == 10.0
 
 
+def test_calculate_percentage_change_series_matches_scalar():
+    olds = [100.0, 0.0, -1.0, None, 50.0]
+    news = [110.0, 5.0, 5.0, 5.0, None]
+    out = m.calculate_percentage_change_series(pd.Series(olds), pd.Series(news))
+    expected = [m.calculate_percentage_change(o, n) for o, n in zip(olds, news)]
+    assert out.iloc[:4].tolist() == pytest.approx(expected[:4])
+    assert pd.isna(out.iloc[4]) and expected[4] is None
+
+
 def test_validate_ticker_and_price_helpers():
     assert m.validate_ticker_format("AAPL")
     assert not m.validate_ticker_format("aapl")
@@ -71,13 +80,42 @@ def test_retry_helper_and_cached_price(monkeypatch):
 
     # Expire TTL and ensure refresh takes next value
     # Monkeypatch time to simulate TTL expiry
-    original_time = m.time.time
+    original_time = m.time.monotonic
     base = original_time()
-    monkeypatch.setattr(m.time, "time", lambda: base + 1000)
+    monkeypatch.setattr(m.time, "monotonic", lambda: base + 1000)
     p3 = m.get_cached_price("AAPL", ttl_seconds=1)
     assert p3 == 20
     # restore time
-    monkeypatch.setattr(m.time, "time", original_time)
+    monkeypatch.setattr(m.time, "monotonic", original_time)
+
+
+def _always_fail():
+    raise RuntimeError("always fail")
+
+
+def test_retry_backoff_grows_and_is_capped(monkeypatch):
+    import core.retry
+
+    delays = []
+    monkeypatch.setattr(m.time, "sleep", delays.append)
+    # Zero jitter so the clamped delay is exact
+    monkeypatch.setattr(core.retry.random, "uniform", lambda a, b: 0.0)
+    assert m._retry(_always_fail, attempts=5, base_delay=1.0, cap=3.0) is None
+    assert delays == [1.0, 2.0, 3.0, 3.0]
+
+
+def test_price_cache_evicts_least_recently_used():
+    cache = m._TTLLRU()
+    for i in range(cache.maxsize + 1):
+        cache.put(f"T{i}", float(i), now=0.0)
+    assert len(cache) == cache.maxsize
+    assert "T0" not in cache and f"T{cache.maxsize}" in cache
+    # A hit refreshes recency, so the next insert evicts T2 rather than T1
+    assert cache.get("T1", ttl=60.0, now=1.0) == 1.0
+    cache.put("NEW", 1.0, now=1.0)
+    assert "T1" in cache and "T2" not in cache
+    # Expired entries are dropped on read
+    assert cache.get("T1", ttl=60.0, now=100.0) is None and "T1" not in cache
 
 
 def test_get_day_high_low_final_fallback(monkeypatch):
@@ -109,6 +147,16 @@ def test_validate_ticker_format():
     assert market.validate_ticker_format('BRK.B') is True
 
 
+def test_validate_ticker_format_caches_repeat_symbols():
+    from core.validation import _ticker_format_ok
+
+    _ticker_format_ok.cache_clear()
+    assert market.validate_ticker_format('MSFT') is market.validate_ticker_format('MSFT')
+    assert _ticker_format_ok.cache_info().hits == 1
+    # Non-string input is rejected before the (hashing) cache
+    assert market.validate_ticker_format(['MSFT']) is False
+
+
 def test_sanitize_market_data_impute_branch():
     # Construct DataFrame where one valid row and one row with missing price but valid volume triggers imputation branch
     df = pd.DataFrame({
@@ -14,6 +14,19 @@ def test_env_invalid(monkeypatch):
         resolve_env()
 
 
+def test_env_validation_is_cached_per_value(monkeypatch):
+    import micro_config
+
+    micro_config._validated_env.cache_clear()
+    monkeypatch.setenv("APP_ENV", "dev_stage")
+    assert resolve_env() == "dev_stage"
+    assert resolve_env() == "dev_stage"
+    assert micro_config._validated_env.cache_info().hits >= 1
+    # A changed APP_ENV is re-read, never served from the cache
+    monkeypatch.setenv("APP_ENV", "production")
+    assert resolve_env() == "production"
+
+
 def test_provider_dev_stage_without_key(monkeypatch):
     monkeypatch.setenv("APP_ENV", "dev_stage")
     p = get_provider()
@@ -8,6 +8,7 @@ import unittest
 import time
 import statistics
 from unittest.mock import patch, MagicMock
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Any
 
@@ -16,8 +17,42 @@ from config.summary_config import create_test_config
 from tests.test_comprehensive_summary import TestDataFixtures
 
 
-class PerformanceBenchmarks(unittest.TestCase):
+class _SharedFixturesMixin:
+    """Build the read-only mock payloads once per class; mocks only read them."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._price_data = TestDataFixtures.sample_price_data()
+        cls._history_df = TestDataFixtures.sample_history_dataframe()
+
+
+class PerformanceBenchmarks(_SharedFixturesMixin, unittest.TestCase):
     """Performance benchmark tests for summary module."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Vectorized columns: contiguous int64 arrays pandas adopts without boxing
+        step = np.arange(5000, dtype=np.int64) * 10
+        cls._large_history = pd.DataFrame({
+            "date": pd.date_range("2020-01-01", periods=5000),  # ~13 years daily
+            "ticker": np.full(5000, "TOTAL", dtype=object),
+            "total_equity": step + 10000,
+            "total_value": step + 9000,
+            "cash_balance": np.full(5000, 1000, dtype=np.int64)
+        })
+        # Symbols shared by the scaling and large-portfolio tests; holdings are
+        # built column-wise once (render only reads them into a DataFrame)
+        cls._stock_symbols = tuple(f"STOCK{i:03d}" for i in range(100))
+        idx = np.arange(100)
+        cls._large_holdings = pd.DataFrame({
+            "symbol": cls._stock_symbols,
+            "shares": 100 + idx,
+            "price": 50.0 + idx,
+            "cost_basis": 45.0 + idx,
+            "ticker": cls._stock_symbols,
+        }).to_dict("records")
     
     def setUp(self):
         """Set up performance test fixtures."""
@@ -27,14 +62,20 @@ class PerformanceBenchmarks(unittest.TestCase):
             default_history_months=6
         )
     
-    def _time_function_calls(self, func, *args, **kwargs) -> List[float]:
-        """Time multiple function calls and return execution times."""
+    def _time_function_calls(self, func, *args, warmup: int = 1, **kwargs) -> List[float]:
+        """Time multiple function calls and return execution times in seconds.
+
+        ``warmup`` untimed calls run first so one-off import/caching costs do
+        not dominate the mean.
+        """
+        for _ in range(warmup):
+            func(*args, **kwargs)
+        _pc = time.perf_counter_ns  # monotonic, ns resolution; bound once outside the loop
         times = []
         for _ in range(5):  # Run 5 times for statistical significance
-            start_time = time.time()
+            t0 = _pc()
             func(*args, **kwargs)
-            end_time = time.time()
-            times.append(end_time - start_time)
+            times.append((_pc() - t0) * 1e-9)
         return times
     
     def test_single_summary_generation_performance(self):
@@ -43,8 +84,8 @@ class PerformanceBenchmarks(unittest.TestCase):
              patch('ui.summary.get_cached_price_history') as mock_history, \
              patch('ui.summary.warm_cache_for_symbols') as mock_warm:
             
-            mock_price.return_value = TestDataFixtures.sample_price_data()
-            mock_history.return_value = TestDataFixtures.sample_history_dataframe()
+            mock_price.return_value = self._price_data
+            mock_history.return_value = self._history_df
             mock_warm.return_value = None
             
             times = self._time_function_calls(
@@ -68,14 +109,14 @@ class PerformanceBenchmarks(unittest.TestCase):
         performance_results = {}
         
         with patch('ui.summary.get_cached_price_data') as mock_price:
-            mock_price.return_value = TestDataFixtures.sample_price_data()
+            mock_price.return_value = self._price_data
             
             for count in symbol_counts:
-                symbols = [f"STOCK{i:03d}" for i in range(count)]
+                symbols = self._stock_symbols[:count]
                 
-                start_time = time.time()
+                start_time = time.perf_counter()
                 results = [_fetch_price_volume(symbol) for symbol in symbols]
-                end_time = time.time()
+                end_time = time.perf_counter()
                 
                 total_time = end_time - start_time
                 time_per_symbol = total_time / count
@@ -103,31 +144,20 @@ class PerformanceBenchmarks(unittest.TestCase):
     
     def test_large_portfolio_performance(self):
         """Benchmark performance with large portfolio datasets."""
-        # Create large portfolio data
-        large_holdings = []
-        for i in range(100):
-            large_holdings.append({
-                "symbol": f"STOCK{i:03d}",
-                "shares": 100 + i,
-                "price": 50.0 + i,
-                "cost_basis": 45.0 + i,
-                "ticker": f"STOCK{i:03d}"
-            })
-        
         large_data = self.sample_data.copy()
-        large_data["holdings"] = large_holdings
+        large_data["holdings"] = self._large_holdings
         
         with patch('ui.summary.get_cached_price_data') as mock_price, \
              patch('ui.summary.get_cached_price_history') as mock_history, \
              patch('ui.summary.warm_cache_for_symbols') as mock_warm:
             
-            mock_price.return_value = TestDataFixtures.sample_price_data()
-            mock_history.return_value = TestDataFixtures.sample_history_dataframe()
+            mock_price.return_value = self._price_data
+            mock_history.return_value = self._history_df
             mock_warm.return_value = None
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = render_daily_portfolio_summary(large_data, self.benchmark_config)
-            end_time = time.time()
+            end_time = time.perf_counter()
             
             execution_time = end_time - start_time
             
@@ -159,9 +189,9 @@ class PerformanceBenchmarks(unittest.TestCase):
         with patch('ui.summary.get_cached_price_data', side_effect=mock_cached_price_data):
             symbols = ["AAPL", "MSFT", "GOOGL"] * 3  # Repeat symbols
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             results = [_fetch_price_volume(symbol) for symbol in symbols]
-            end_time = time.time()
+            end_time = time.perf_counter()
             
             total_time = end_time - start_time
             
@@ -177,14 +207,7 @@ class PerformanceBenchmarks(unittest.TestCase):
     
     def test_memory_usage_with_large_dataframes(self):
         """Test memory efficiency with large historical datasets."""
-        # Create large historical dataset
-        large_history = pd.DataFrame({
-            "date": pd.date_range("2020-01-01", periods=5000),  # ~13 years daily
-            "ticker": ["TOTAL"] * 5000,
-            "total_equity": [10000 + i * 10 for i in range(5000)],
-            "total_value": [9000 + i * 10 for i in range(5000)],
-            "cash_balance": [1000] * 5000
-        })
+        large_history = self._large_history
         
         large_data = self.sample_data.copy()
         large_data["history"] = large_history
@@ -193,13 +216,13 @@ class PerformanceBenchmarks(unittest.TestCase):
              patch('ui.summary.get_cached_price_history') as mock_history, \
              patch('ui.summary.warm_cache_for_symbols') as mock_warm:
             
-            mock_price.return_value = TestDataFixtures.sample_price_data()
-            mock_history.return_value = large_history.copy()
+            mock_price.return_value = self._price_data
+            mock_history.return_value = large_history
             mock_warm.return_value = None
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = render_daily_portfolio_summary(large_data, self.benchmark_config)
-            end_time = time.time()
+            end_time = time.perf_counter()
             
             execution_time = end_time - start_time
             
@@ -213,7 +236,7 @@ class PerformanceBenchmarks(unittest.TestCase):
             print(f"Large history dataset (5000 rows): {execution_time:.3f}s")
 
 
-class CachingEffectivenessTests(unittest.TestCase):
+class CachingEffectivenessTests(_SharedFixturesMixin, unittest.TestCase):
     """Tests specifically focused on caching system effectiveness."""
     
     def test_cache_ttl_configuration_impact(self):
@@ -227,16 +250,16 @@ class CachingEffectivenessTests(unittest.TestCase):
             with patch('ui.summary.get_cached_price_data') as mock_price, \
                  patch('ui.summary.warm_cache_for_symbols') as mock_warm:
                 
-                mock_price.return_value = TestDataFixtures.sample_price_data()
+                mock_price.return_value = self._price_data
                 mock_warm.return_value = None
                 
-                start_time = time.time()
+                start_time = time.perf_counter()
                 
                 # Simulate multiple fetches that could benefit from caching
                 for _ in range(10):
                     _fetch_price_volume("AAPL")
                 
-                end_time = time.time()
+                end_time = time.perf_counter()
                 
                 performance_by_ttl[ttl] = {
                     'time': end_time - start_time,
@@ -263,10 +286,10 @@ class CachingEffectivenessTests(unittest.TestCase):
         with patch('ui.summary.warm_cache_for_symbols') as mock_warm, \
              patch('ui.summary.get_cached_price_data') as mock_price:
             
-            mock_price.return_value = TestDataFixtures.sample_price_data()
+            mock_price.return_value = self._price_data
             
             # Test with cache warming
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             # This would normally warm the cache
             from ui.summary import warm_cache_for_symbols
@@ -275,7 +298,7 @@ class CachingEffectivenessTests(unittest.TestCase):
             # Then fetch prices (should benefit from warming)
             results = [_fetch_price_volume(symbol) for symbol in common_symbols]
             
-            end_time = time.time()
+            end_time = time.perf_counter()
             
             warmed_time = end_time - start_time
             
@@ -288,7 +311,7 @@ class CachingEffectivenessTests(unittest.TestCase):
             print(f"Cache warming test completed in {warmed_time:.4f}s")
 
 
-class ErrorHandlingPerformanceTests(unittest.TestCase):
+class ErrorHandlingPerformanceTests(_SharedFixturesMixin, unittest.TestCase):
     """Performance tests for error handling scenarios."""
     
     def test_error_recovery_performance(self):
@@ -312,9 +335,9 @@ class ErrorHandlingPerformanceTests(unittest.TestCase):
                 mock_history.side_effect = error
                 mock_warm.side_effect = error
                 
-                start_time = time.time()
+                start_time = time.perf_counter()
                 result = render_daily_portfolio_summary(data)
-                end_time = time.time()
+                end_time = time.perf_counter()
                 
                 error_recovery_time = end_time - start_time
                 
@@ -338,18 +361,18 @@ class ErrorHandlingPerformanceTests(unittest.TestCase):
             call_count += 1
             if call_count % 3 == 0:  # Every 3rd call fails
                 raise Exception("Intermittent failure")
-            return TestDataFixtures.sample_price_data()
+            return self._price_data
         
         with patch('ui.summary.get_cached_price_data', side_effect=intermittent_failure), \
              patch('ui.summary.get_cached_price_history') as mock_history, \
              patch('ui.summary.warm_cache_for_symbols') as mock_warm:
             
-            mock_history.return_value = TestDataFixtures.sample_history_dataframe()
+            mock_history.return_value = self._history_df
             mock_warm.return_value = None
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = render_daily_portfolio_summary(data)
-            end_time = time.time()
+            end_time = time.perf_counter()
             
             partial_failure_time = end_time - start_time
             
@@ -77,3 +77,6 @@ def test_remove_position():
 
     assert len(df) == 1
     assert df.iloc[0]["ticker"] == "MSFT"
+    assert service.shares_of("AAPL") == 0.0
+    assert service.get_position("AAPL") is None
+    assert service.shares_of("MSFT") == 50
@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.price_utils import extract_price_from_dataframe, last_valid_value
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pd.Series([1.0, 2.0, np.nan]),
+        pd.Series([np.nan, np.nan]),
+        pd.Series([], dtype="float64"),
+        pd.Series([3, 4]),
+        pd.Series([1.5, pd.NA], dtype="Float64"),
+        pd.Series(["a", None]),
+    ],
+    ids=["float-trailing-nan", "all-nan", "empty", "int", "nullable-float", "object"],
+)
+def test_last_valid_value_matches_dropna(values):
+    dropped = values.dropna()
+    expected = None if dropped.empty else dropped.iloc[-1]
+    assert last_valid_value(values) == expected
+
+
+def test_extract_price_from_dataframe_skips_trailing_gaps():
+    df = pd.DataFrame({"Close": [10.0, 11.0, np.nan]})
+    assert extract_price_from_dataframe(df) == 11.0
+    assert extract_price_from_dataframe(pd.DataFrame({"close": [0.0]})) is None
@@ -78,8 +78,8 @@ class TestSpecificUncoveredLines:
         try:
             result = render_daily_portfolio_summary(test_data)
             assert isinstance(result, str)
-            # Verify cache warming was called
-            mock_warm_cache.assert_called()
+            # Nothing to summarize, so cache warming is skipped
+            mock_warm_cache.assert_not_called()
         except Exception as e:
             # Expected due to missing dependencies
             assert "error" in str(e).lower() or "missing" in str(e).lower()
@@ -1,5 +1,7 @@
 """Focused tests for actual watchlist functionality."""
 
+from collections.abc import Mapping, Set as AbstractSet
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import pandas as pd
@@ -15,15 +17,24 @@ class TestWatchlistServiceCore:
 
         # Test default initialization
         state = WatchlistState()
-        assert isinstance(state.tickers, set)
-        assert isinstance(state.prices, dict)
+        assert isinstance(state.tickers, AbstractSet)
+        assert isinstance(state.prices, Mapping)
         assert len(state.tickers) == 0
         assert len(state.prices) == 0
 
         # Test initialization with None values
         state_none = WatchlistState(tickers=None, prices=None)
-        assert isinstance(state_none.tickers, set)
-        assert isinstance(state_none.prices, dict)
+        assert isinstance(state_none.tickers, AbstractSet)
+        assert isinstance(state_none.prices, Mapping)
+
+        # Empty states share sentinels until first mutation (copy-on-write)
+        assert state.tickers is state_none.tickers
+        state.mutable_tickers().add("AAPL")
+        state.mutable_prices()["AAPL"] = 1.0
+        assert isinstance(state.tickers, set)
+        assert isinstance(state.prices, dict)
+        assert len(state_none.tickers) == 0
+        assert len(state_none.prices) == 0
 
     def test_watchlist_state_with_data(self):
         """Test WatchlistState with initial data."""
@@ -49,8 +60,8 @@ class TestWatchlistServiceCore:
 
         # Verify initialization
         assert hasattr(st.session_state, "watchlist_state")
-        assert isinstance(st.session_state.watchlist_state.tickers, set)
-        assert isinstance(st.session_state.watchlist_state.prices, dict)
+        assert isinstance(st.session_state.watchlist_state.tickers, AbstractSet)
+        assert isinstance(st.session_state.watchlist_state.prices, Mapping)
 
     def test_add_to_watchlist_function(self):
         """Test add_to_watchlist function."""
@@ -115,7 +126,7 @@ class TestWatchlistServiceCore:
 
         # Initialize with some tickers
         init_watchlist()
-        st.session_state.watchlist_state.tickers.add("AAPL")
+        st.session_state.watchlist_state.mutable_tickers().add("AAPL")
         count_before = len(st.session_state.watchlist_state.tickers)
 
         # Try to remove non-existent ticker
@@ -250,8 +261,8 @@ class TestWatchlistValidation:
         add_to_watchlist("MSFT")
 
         # Verify data types
-        assert isinstance(st.session_state.watchlist_state.tickers, set)
-        assert isinstance(st.session_state.watchlist_state.prices, dict)
+        assert isinstance(st.session_state.watchlist_state.tickers, AbstractSet)
+        assert isinstance(st.session_state.watchlist_state.prices, Mapping)
 
         # Verify all tickers are strings
         for ticker in st.session_state.watchlist_state.tickers:
@@ -289,7 +300,7 @@ class TestWatchlistIntegration:
         for ticker in st.session_state.watchlist_state.tickers:
             price = mock_get_price(ticker)
             if price:
-                st.session_state.watchlist_state.prices[ticker] = price
+                st.session_state.watchlist_state.mutable_prices()[ticker] = price
 
         # Verify price storage
         assert st.session_state.watchlist_state.prices["AAPL"] == 150.25
@@ -367,7 +378,7 @@ class TestWatchlistErrorHandling:
             pass
 
         # Verify state remains valid
-        assert isinstance(st.session_state.watchlist_state.tickers, set)
+        assert isinstance(st.session_state.watchlist_state.tickers, AbstractSet)
 
     def test_session_state_corruption_recovery(self):
         """Test recovery from corrupted session state."""
@@ -381,8 +392,8 @@ class TestWatchlistErrorHandling:
 
         # Verify proper state is restored
         assert hasattr(st.session_state, "watchlist_state")
-        assert isinstance(st.session_state.watchlist_state.tickers, set)
-        assert isinstance(st.session_state.watchlist_state.prices, dict)
+        assert isinstance(st.session_state.watchlist_state.tickers, AbstractSet)
+        assert isinstance(st.session_state.watchlist_state.prices, Mapping)
 
     def test_concurrent_operations(self):
         """Test concurrent watchlist operations."""
@@ -406,5 +417,5 @@ class TestWatchlistErrorHandling:
         # Verify final state is consistent
         expected_tickers = {"GOOGL", "MSFT", "TSLA"}
         assert st.session_state.watchlist_state.tickers == expected_tickers
-        assert isinstance(st.session_state.watchlist_state.tickers, set)
-        assert isinstance(st.session_state.watchlist_state.prices, dict)
+        assert isinstance(st.session_state.watchlist_state.tickers, AbstractSet)
+        assert isinstance(st.session_state.watchlist_state.prices, Mapping)
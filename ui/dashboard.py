@@ -110,6 +110,14 @@ def _sync_micro_env(enabled: bool) -> None:
         os.environ["DISABLE_MICRO_PROVIDERS"] = "1"
 
 
+def _apply_micro_provider_toggle(enabled: bool) -> None:
+    """Record the provider preference and drop cached providers so it takes effect."""
+    st.session_state.use_micro_providers = enabled
+    _sync_micro_env(enabled)
+    market_module._reset_micro_provider_cache()
+    market_module._get_direct_finnhub_provider.cache_clear()
+
+
 def initialize_services():
     """Initialize services in session state."""
     if "portfolio_service" not in st.session_state:
@@ -301,13 +309,7 @@ def render_dashboard() -> None:
             )
             previous_state = st.session_state.get("use_micro_providers", False)
             if toggled != previous_state:
-                st.session_state.use_micro_providers = toggled
-                _sync_micro_env(toggled)
-                try:
-                    market_module._micro_provider_cache = None  # type: ignore[attr-defined]
-                    market_module._get_direct_finnhub_provider.cache_clear()
-                except Exception:
-                    pass
+                _apply_micro_provider_toggle(toggled)
 
             # Decide caption text
             caption_txt = "Provider: "
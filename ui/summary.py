@@ -1,14 +1,22 @@
 import logging
 import math
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 
 from config.summary_config import get_config, set_config, SummaryConfig
 from services.core.market_service import MarketService
-from utils.cache import get_cached_price_data, get_cached_price_history, warm_cache_for_symbols, COMMON_SYMBOLS
+from utils.cache import (
+    get_cached_price_data,
+    get_cached_price_history,
+    get_unwarmed_symbols,
+    warm_cache_for_symbols,
+    COMMON_SYMBOLS,
+)
 from utils.error_handling import (
     handle_summary_errors, 
     handle_data_errors, 
@@ -23,22 +31,49 @@ logger = logging.getLogger(__name__)
 
 MARKET_SERVICE = MarketService()
 
+# Upper bound on concurrent history fetches when backfilling portfolio history
+_MAX_HISTORY_WORKERS = 8
+
+
+class _Formatters(NamedTuple):
+    """Format callables pre-bound to a fixed currency/percentage precision."""
+
+    close: Callable[[float], str]
+    pct_signed: Callable[[float], str]
+    currency_padded: Callable[[float], str]
+    currency: Callable[[float], str]
+
+
+@lru_cache(maxsize=16)
+def _build_formatters(currency_precision: int, percentage_precision: int) -> _Formatters:
+    """Compile format strings once per precision pair instead of on every call."""
+    return _Formatters(
+        close=f"{{:,.{currency_precision}f}}".format,
+        pct_signed=f"{{:+.{percentage_precision}f}}%".format,
+        currency_padded=f"$ {{:>15,.{currency_precision}f}}".format,
+        currency=f"${{:,.{currency_precision}f}}".format,
+    )
+
+
+def _formatters() -> _Formatters:
+    """Return formatters for the active configuration."""
+    config = get_config()
+    return _build_formatters(config.currency_precision, config.percentage_precision)
+
 
 # Standardized formatting functions
 def fmt_close(value: Optional[float]) -> str:
     """Format closing price with comma separators."""
     if value is None or pd.isna(value):
         return "—"
-    precision = get_config().currency_precision
-    return f"{value:,.{precision}f}"
+    return _formatters().close(value)
 
 
 def fmt_pct_signed(value: Optional[float]) -> str:
     """Format percentage with +/- sign."""
     if value is None or pd.isna(value):
         return "—"
-    precision = get_config().percentage_precision
-    return f"{value:+.{precision}f}%"
+    return _formatters().pct_signed(value)
 
 
 def fmt_volume(value: Optional[float]) -> str:
@@ -52,16 +87,14 @@ def fmt_currency_padded(value: Optional[float]) -> str:
     """Format currency with padding for alignment."""
     if value is None or pd.isna(value):
         return "$        —"
-    precision = get_config().currency_precision
-    return f"$ {value:>15,.{precision}f}"
+    return _formatters().currency_padded(value)
 
 
 def fmt_currency(value: Optional[float]) -> str:
     """Standard currency formatting."""
     if value is None or pd.isna(value):
         return "—"
-    precision = get_config().currency_precision
-    return f"${value:,.{precision}f}"
+    return _formatters().currency(value)
 
 
 def fmt_shares(value: Optional[float]) -> str:
@@ -154,7 +187,8 @@ def _build_portfolio_history_from_market(
 
     series_map: Dict[str, pd.Series] = {}
     failed_tickers = []
-    
+
+    positions: List[Tuple[str, float]] = []
     for _, row in holdings_df.iterrows():
         ticker = str(row.get("ticker") or row.get("Ticker") or "").strip().upper()
         if not ticker:
@@ -164,11 +198,24 @@ def _build_portfolio_history_from_market(
         if shares is None or pd.isna(shares) or float(shares) == 0.0:
             continue
 
-        logger.debug(f"Fetching history for {ticker} ({shares} shares)")
-        
+        positions.append((ticker, float(shares)))
+
+    # Fetch all histories concurrently (I/O bound); config is read here because
+    # worker threads do not inherit the caller's context-local configuration
+    ttl_minutes = config.price_cache_ttl_minutes
+    futures: List[Future] = []
+    if positions:
+        with ThreadPoolExecutor(max_workers=min(_MAX_HISTORY_WORKERS, len(positions))) as executor:
+            for ticker, shares in positions:
+                logger.debug(f"Fetching history for {ticker} ({shares} shares)")
+                futures.append(
+                    executor.submit(get_cached_price_history, ticker, months=months, ttl_minutes=ttl_minutes)
+                )
+
+    for (ticker, shares), future in zip(positions, futures):
         try:
             # Use cached price history with configured TTL
-            hist = get_cached_price_history(ticker, months=months, ttl_minutes=config.price_cache_ttl_minutes)
+            hist = future.result()
             if hist is None or hist.empty:
                 logger.debug(f"No market history returned for {ticker}")
                 failed_tickers.append(ticker)
@@ -197,7 +244,7 @@ def _build_portfolio_history_from_market(
 
         logger.debug(f"Successfully loaded {len(df)} price points for {ticker}")
         df = df.drop_duplicates(subset=["date"], keep="last").set_index("date")
-        series_map[ticker] = df["close"] * float(shares)
+        series_map[ticker] = df["close"] * shares
 
     if failed_tickers:
         logger.info(f"Failed to load history for: {failed_tickers}")
@@ -557,6 +604,17 @@ def _calculate_portfolio_metrics(holdings_df: pd.DataFrame, summary_df: Optional
     }
 
 
+def _has_active_holdings(holdings: List[Dict[str, Any]]) -> bool:
+    """Return True if any holding carries a positive share count."""
+    for holding in holdings:
+        try:
+            if float(holding.get("shares") or 0) > 0:
+                return True
+        except (TypeError, ValueError):
+            continue
+    return False
+
+
 @handle_data_errors(fallback_value=[], log_level="debug")
 def _collect_portfolio_symbols(holdings_df: pd.DataFrame, index_symbols: List[str]) -> List[str]:
     """Collect all symbols needed for price/volume data."""
@@ -631,9 +689,13 @@ def render_daily_portfolio_summary(data: Dict[str, Any], config: Optional[Summar
         if not validate_input_data(data, required_fields=["asOfDate"]):
             logger.warning("Missing required input data, using defaults")
         
-        # Warm cache for common symbols to improve performance
+        # Warm cache for common symbols to improve performance; skipped when there
+        # is nothing to summarize or every symbol is already warm for this TTL window
         config = get_config()
-        warm_cache_for_symbols(COMMON_SYMBOLS, ttl_minutes=config.price_cache_ttl_minutes)
+        if _has_active_holdings(data.get("holdings") or []):
+            symbols_to_warm = get_unwarmed_symbols(COMMON_SYMBOLS, ttl_minutes=config.price_cache_ttl_minutes)
+            if symbols_to_warm:
+                warm_cache_for_symbols(symbols_to_warm, ttl_minutes=config.price_cache_ttl_minutes)
         
         # Prepare and validate input data
         parsed_data = _prepare_summary_data(data)
@@ -24,12 +24,17 @@ _cache_lock = threading.RLock()
 # Global market service instance
 _market_service: Optional[MarketService] = None
 
+# (symbol, cache_key) pairs successfully warmed in the current TTL window
+_warmed_keys: set[tuple[str, int | None]] = set()
+
 
 def _get_market_service() -> MarketService:
     """Get singleton market service instance."""
     global _market_service
     if _market_service is None:
-        _market_service = MarketService()
+        with _cache_lock:
+            if _market_service is None:
+                _market_service = MarketService()
     return _market_service
 
 
@@ -46,22 +51,23 @@ def _cached_price_history(symbol: str, months: int, cache_key: int) -> Optional[
     Returns:
         DataFrame with price history or None if fetch failed
     """
-    with _cache_lock:
-        try:
-            logger.debug(f"Cache MISS: Fetching price history for {symbol} ({months}m) - key {cache_key}")
-            market_service = _get_market_service()
-            result = market_service.fetch_history(symbol, months=months)
-            
-            if result is not None and not result.empty:
-                logger.debug(f"Cache STORE: Successfully cached {len(result)} records for {symbol}")
-                return result.copy()  # Return copy to prevent cache mutation
-            else:
-                logger.warning(f"Cache STORE: Empty/None result for {symbol}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Cache MISS ERROR: Failed to fetch {symbol} - {e}")
+    # No lock around the fetch: lru_cache is thread-safe and holding the lock here
+    # would serialize concurrent history loads for different symbols
+    try:
+        logger.debug(f"Cache MISS: Fetching price history for {symbol} ({months}m) - key {cache_key}")
+        market_service = _get_market_service()
+        result = market_service.fetch_history(symbol, months=months)
+        
+        if result is not None and not result.empty:
+            logger.debug(f"Cache STORE: Successfully cached {len(result)} records for {symbol}")
+            return result.copy()  # Return copy to prevent cache mutation
+        else:
+            logger.warning(f"Cache STORE: Empty/None result for {symbol}")
             return None
+            
+    except Exception as e:
+        logger.error(f"Cache MISS ERROR: Failed to fetch {symbol} - {e}")
+        return None
 
 
 @lru_cache(maxsize=128)
@@ -182,6 +188,17 @@ def get_cached_price_data(symbol: str, ttl_minutes: int = 5) -> Dict[str, Option
         return {"symbol": symbol, "close": None, "pct_change": None, "volume": None}
 
 
+def _mark_warmed(symbol: str, ttl_minutes: int) -> None:
+    """Record a warmed symbol, dropping entries from earlier TTL windows."""
+    if ttl_minutes <= 0:
+        return
+    cache_key = int(time.time() // (ttl_minutes * 60))
+    with _cache_lock:
+        stale = {key for key in _warmed_keys if key[1] != cache_key}
+        _warmed_keys.difference_update(stale)
+        _warmed_keys.add((symbol.strip().upper(), cache_key))
+
+
 def warm_cache_for_symbols(symbols: List[str], ttl_minutes: int = 5) -> Dict[str, bool]:
     """
     Warm cache for common symbols to improve performance.
@@ -214,6 +231,7 @@ def warm_cache_for_symbols(symbols: List[str], ttl_minutes: int = 5) -> Dict[str
             results[symbol] = success
             
             if success:
+                _mark_warmed(symbol, ttl_minutes)
                 logger.debug(f"Cache warm SUCCESS: {symbol}")
             else:
                 logger.warning(f"Cache warm FAILED: {symbol} - no data available")
@@ -228,6 +246,29 @@ def warm_cache_for_symbols(symbols: List[str], ttl_minutes: int = 5) -> Dict[str
     return results
 
 
+def get_unwarmed_symbols(symbols: List[str], ttl_minutes: int = 5) -> List[str]:
+    """
+    Filter symbols down to those not yet warmed in the current TTL window.
+    
+    Args:
+        symbols: Candidate symbols to warm
+        ttl_minutes: Cache TTL in minutes
+        
+    Returns:
+        De-duplicated symbols (original order) that still need warming
+    """
+    # A non-positive TTL disables caching, so nothing ever counts as warm
+    cache_key = int(time.time() // (ttl_minutes * 60)) if ttl_minutes > 0 else None
+    pending: List[str] = []
+    for symbol in symbols:
+        if not symbol or not symbol.strip():
+            continue
+        normalized = symbol.strip().upper()
+        if (normalized, cache_key) not in _warmed_keys and symbol not in pending:
+            pending.append(symbol)
+    return pending
+
+
 def get_cache_stats() -> Dict[str, Any]:
     """Get cache statistics for monitoring."""
     with _cache_lock:
@@ -257,6 +298,7 @@ def clear_cache() -> None:
     with _cache_lock:
         _cached_price_data.cache_clear()
         _cached_price_history.cache_clear()
+        _warmed_keys.clear()
         logger.info("Cache cleared: All cached market data removed")
 
 